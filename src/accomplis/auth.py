@@ -16,18 +16,28 @@ CLI:
     accomplis auth                 # Print setup instructions
 """
 
+import hashlib
+import json
 import sys
+import time
 
-from accomplis.token_store import get_token_quiet, store_token
+from accomplis.name_cache import cache_dir
+from accomplis.token_store import UNCHANGED, get_token_quiet, store_token
 
 TODOIST_TOKEN_URL = "https://app.todoist.com/app/settings/integrations/developer"
 
+# A verified (or rejected) token's status is reused for this long, so
+# scripts checking `accomplis auth --status` before each step don't each
+# pay an API round trip
+STATUS_TTL_SECONDS = 60
 
-def store_api_token(token: str) -> bool:
+
+def store_api_token(token: str, force: bool = False) -> bool:
     """
     Validate and store a Todoist API token.
 
-    Returns True on success, False on failure.
+    Returns True on success, False on failure. An already-stored token is
+    not rewritten unless force is set.
     """
     if not token:
         print("No token provided.", file=sys.stderr)
@@ -38,20 +48,55 @@ def store_api_token(token: str) -> bool:
         print("Warning: Token doesn't look like a Todoist API token (expected 40 hex chars).", file=sys.stderr)
         print("Storing anyway -- accomplis doctor will verify it works.\n", file=sys.stderr)
 
-    if not store_token(token):
+    result = store_token(token, force=force)
+    if not result:
         return False
 
-    print("Token stored. Run `accomplis doctor` to verify.")
+    if result == UNCHANGED:
+        print("Token already stored; nothing to change (--force rewrites it).")
+    else:
+        print("Token stored. Run `accomplis doctor` to verify.")
     return True
 
 
-def get_auth_status() -> dict:
+def _status_cache_file():
+    return cache_dir() / "auth-status.json"
+
+
+def _cached_status(token_sha256: str) -> dict | None:
+    """The status verified for this token in the last STATUS_TTL_SECONDS, or None."""
+    try:
+        cached = json.loads(_status_cache_file().read_text())
+        if (cached["token_sha256"] == token_sha256
+                and time.time() - cached["verified_at"] < STATUS_TTL_SECONDS):
+            return {"authenticated": cached["authenticated"], "message": cached["message"]}
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_status(token_sha256: str, status: dict):
+    path = _status_cache_file()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "token_sha256": token_sha256, "verified_at": time.time(), **status,
+        }))
+    except OSError:
+        pass  # uncached: the next check just asks the API again
+
+
+def get_auth_status(use_cache: bool = True) -> dict:
     """
     Check current authentication status.
 
     Returns dict with:
         - authenticated: bool
         - message: str describing status
+
+    A definite answer (token works, or was rejected) is cached for
+    STATUS_TTL_SECONDS, keyed by the token's SHA-256, so a new token is
+    always checked afresh. use_cache=False always asks the API (doctor).
     """
     token = get_token_quiet()
 
@@ -61,28 +106,37 @@ def get_auth_status() -> dict:
             "message": "Not authenticated. Run `accomplis auth --token TOKEN` to set up."
         }
 
+    token_sha256 = hashlib.sha256(token.encode()).hexdigest()
+    if use_cache:
+        cached = _cached_status(token_sha256)
+        if cached is not None:
+            return cached
+
     # Try to verify token works by making a simple API call
+    from accomplis.common import http_status, verify_token
+
     try:
-        from todoist_api_python.api import TodoistAPI
-        api = TodoistAPI(token)
-        # This will fail if token is revoked (first page is enough to verify)
-        next(iter(api.get_projects()), None)
-        return {
+        # Over the shared pooled client: `doctor` checks auth and then lists
+        # projects, and the second call reuses this one's connection
+        verify_token(token)
+        status = {
             "authenticated": True,
             "message": "Authenticated with Todoist."
         }
     except Exception as e:
-        error_str = str(e).lower()
-        if "401" in error_str or "unauthorized" in error_str:
+        if http_status(e) not in (401, 403):
+            # Network error or other issue - assume still authenticated
+            # (not cached: the next check should try again)
             return {
-                "authenticated": False,
-                "message": "Token revoked or expired. Run `accomplis auth --token TOKEN` to re-authenticate."
+                "authenticated": True,
+                "message": f"Token present (could not verify: {e})"
             }
-        # Network error or other issue - assume still authenticated
-        return {
-            "authenticated": True,
-            "message": f"Token present (could not verify: {e})"
+        status = {
+            "authenticated": False,
+            "message": "Token revoked or expired. Run `accomplis auth --token TOKEN` to re-authenticate."
         }
+    _save_status(token_sha256, status)
+    return status
 
 
 def print_setup_instructions():
@@ -109,6 +163,7 @@ def main():
     parser = argparse.ArgumentParser(description="Todoist authentication")
     parser.add_argument("--token", help="API token to store (get from Todoist settings)")
     parser.add_argument("--status", action="store_true", help="Check authentication status")
+    parser.add_argument("--force", action="store_true", help="With --token: rewrite the token even if it's already stored")
 
     args = parser.parse_args()
 
@@ -118,7 +173,7 @@ def main():
         sys.exit(0 if status["authenticated"] else 1)
 
     if args.token:
-        success = store_api_token(args.token)
+        success = store_api_token(args.token, force=args.force)
         sys.exit(0 if success else 1)
 
     # No flags: print instructions
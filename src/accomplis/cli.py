@@ -16,6 +16,8 @@ Commands:
     add-section NAME    Create a new section (--project or --project-id)
     tasks               List tasks with comments inline
                         Supports --project, --section, --older-than, --include-section-name
+                        (--no-comments skips the per-task comment fetch: use it on large projects)
+                        (listings also take --limit N / --offset N)
                         Auto-filters workspace projects to your tasks (--unassigned for triage, --team for all)
     task ID             Get single task with comments inline
     filter QUERY        Filter tasks (no comments - can return many)
@@ -24,11 +26,18 @@ Commands:
     uncomplete ID       Uncomplete/reopen a task
     completed           List completed tasks (--since, --until, --project)
     add CONTENT         Create a new task (--project, --section for placement)
+    add-batch           Create a task tree from JSON on stdin or --file:
+                        {"content": ..., "children": [...]} (or a list of them)
     update ID           Update/move task (--content, --project, --section, --no-section, --order, etc.)
     reorder ID [ID...]  Set task order to the sequence given (first = top)
     comments            Get comments standalone (rarely needed)
     collaborators       Get project collaborators (requires --project-id)
     whoami              Show current authenticated user
+    daemon              Serve calls from one warm process (set ACCOMPLIS_DAEMON=1 to use it)
+
+Name cache:
+    Project and section names resolve from ~/.cache/accomplis/names.json
+    for 10 minutes; `accomplis --refresh-cache <command>` re-fetches them.
 
 Authentication:
     Run `accomplis auth` to set up (opens Todoist settings, prompts for token).
@@ -38,39 +47,233 @@ Authentication:
 
 import argparse
 import json
+import os
 import re
 import sys
-from datetime import datetime, timedelta
+import textwrap
+from dataclasses import is_dataclass
+from itertools import chain, islice
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 from accomplis.common import (
     get_api,
     get_current_user,
     collect_paginated,
+    iter_paginated,
+    prefetch_pages,
     to_dict,
     resolve_project,
     resolve_project_object,
     resolve_section,
     resolve_assignee,
+    list_sections,
+    list_collaborators,
+    names_changed,
+    imap_concurrent,
     handle_task_not_found,
+    http_status,
     api_call_with_retry,
     DEFAULT_TIMEOUT,
 )
 
+try:
+    import orjson  # optional fast path: pip install 'accomplis[fast]'
+except ImportError:
+    orjson = None
+
+# orjson formats datetimes natively; UTC_Z matches the SDK's own "...Z" style
+_ORJSON_OPTS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+    if orjson else 0
+)
+
+
+def _json_default(obj):
+    """Encode what JSON can't: dates as ISO 8601, stray SDK models as dicts."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat().replace("+00:00", "Z")
+    if callable(getattr(obj, 'to_dict', None)):
+        return obj.to_dict()
+    return str(obj)
+
+
+def _dumps(obj) -> str:
+    """Serialize to 2-space-indented JSON, via orjson when it's installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTS).decode()
+    return json.dumps(obj, indent=2, default=_json_default)
+
+
+# --older-than values like '30d', '2w', '3m' (months approximated as 30 days)
+_AGE_RE = re.compile(r'(\d+)([dwm])')
+_AGE_UNIT_DAYS = {'d': 1, 'w': 7, 'm': 30}
+
+
+# Names that can go into a filter query verbatim. Anything else (&, |, !, @,
+# #, /, parentheses...) would need escaping, so that clause stays client-side.
+_PLAIN_NAME_RE = re.compile(r'[\w -]+')
+# Days of slack on a pushed-down date: the server counts days in the user's
+# Todoist timezone, which can sit over a day away from this machine's.
+_FILTER_DATE_SLACK_DAYS = 2
+
+
+def _filter_query(cutoff, project_name=None, section_name=None, label=None):
+    """
+    Todoist filter query that applies a date cutoff server-side, or None.
+
+    The date is the one filter get_tasks can't express, so it's only worth
+    switching endpoints for one. Every clause matches a superset of what the
+    client keeps (the client re-checks everything), so a section or label
+    the syntax can't carry verbatim is simply left out. A project name can't
+    be: without it the query would span every project.
+    """
+    days = (_utc_now() - cutoff).days - _FILTER_DATE_SLACK_DAYS
+    if days < 1:
+        return None
+    clauses = []
+    if project_name is not None:
+        if not _PLAIN_NAME_RE.fullmatch(project_name):
+            return None
+        clauses.append(f"#{project_name}")
+    if section_name and _PLAIN_NAME_RE.fullmatch(section_name):
+        clauses.append(f"/{section_name}")
+    if label and _PLAIN_NAME_RE.fullmatch(label):
+        clauses.append(f"@{label}")
+    clauses.append(f"created before: -{days} days")
+    return " & ".join(clauses)
+
+
+def _utc_now():
+    """Current UTC time as a naive datetime, the form cutoffs are kept in."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _date_cutoff(args):
+    """
+    The --older-than / --created-before cutoff as naive UTC, or None.
+
+    created_at is UTC, so the cutoff must be too: a local-time cutoff would
+    shift the boundary by the machine's UTC offset. A --created-before date
+    means the end of that day where the user is.
+    """
+    if args.older_than:
+        match = _AGE_RE.fullmatch(args.older_than)
+        if not match:
+            print("Error: --older-than format should be like '30d', '2w', or '3m'", file=sys.stderr)
+            sys.exit(1)
+        num, unit = int(match.group(1)), match.group(2)
+        return _utc_now() - timedelta(days=num * _AGE_UNIT_DAYS[unit])
+    if args.created_before:
+        end_of_day = datetime.fromisoformat(args.created_before + "T23:59:59")
+        # astimezone() reads a naive datetime as local time
+        return end_of_day.astimezone(timezone.utc).replace(tzinfo=None)
+    return None
+
+
+def _created_before(cutoff):
+    """Return a predicate: was the task created before `cutoff` (naive UTC)?
+
+    Compares created_at's wall-clock fields against the cutoff without
+    parsing per task: ISO strings compare lexicographically on their first
+    19 chars, and UTC datetimes (what the SDK yields) against a UTC-pinned
+    copy of the cutoff.
+    """
+    cutoff_iso = cutoff.isoformat()
+    cutoff_utc = cutoff.replace(tzinfo=timezone.utc)
+
+    def before(t):
+        ca = t.created_at
+        if isinstance(ca, str):
+            return ca[:19] < cutoff_iso
+        if ca.tzinfo is timezone.utc:
+            return ca < cutoff_utc
+        return ca.replace(tzinfo=None) < cutoff
+
+    return before
+
+
+def _prepared(obj):
+    """
+    What to hand the serializer for obj.
+
+    orjson walks dataclasses (the SDK's models) natively and yields exactly
+    the SDK's to_dict() output, about 4x faster, so they skip conversion.
+    """
+    if orjson is not None and is_dataclass(obj):
+        return obj
+    return to_dict(obj)
+
 
 def output_json(data: Any):
-    """Output data as JSON."""
+    """Output data as JSON, serialized straight to stdout (no whole-document string)."""
     if isinstance(data, list):
-        print(json.dumps([to_dict(item) for item in data], indent=2, default=str))
+        output_json_stream(data)
+    elif orjson is not None:
+        sys.stdout.write(_dumps(_prepared(data)) + "\n")
     else:
-        print(json.dumps(to_dict(data), indent=2, default=str))
+        json.dump(to_dict(data), sys.stdout, indent=2, default=_json_default)
+        sys.stdout.write("\n")
+
+
+def output_json_stream(items):
+    """
+    Output an iterable as a JSON array, writing each element as it arrives.
+
+    Same layout as json.dumps(list, indent=2), but the first page reaches
+    stdout before the last is fetched, and only one element is serialized at
+    a time. If a later page fails, stdout holds a truncated array and the
+    command exits 1 as usual.
+    """
+    opener = "[\n"
+    for item in items:
+        chunk = _dumps(_prepared(item))
+        sys.stdout.write(opener + textwrap.indent(chunk, "  "))
+        opener = ",\n"
+    sys.stdout.write("[]\n" if opener == "[\n" else "\n]\n")
+
+
+def paged(items, args):
+    """
+    Apply --offset/--limit to a lazy item stream.
+
+    Slicing the stream (not a collected list) is the point: once the limit
+    is reached no further page is requested, and nothing past it gets
+    enriched.
+    """
+    offset = getattr(args, 'offset', 0) or 0
+    limit = getattr(args, 'limit', None)
+    if not offset and limit is None:
+        return items
+    return islice(items, offset, None if limit is None else offset + limit)
+
+
+def _check_project_agrees(args, project_id: str):
+    """Exit if --project-id was also given and names a different project than --project."""
+    if args.project_id and args.project_id != project_id:
+        print(f"Error: --project '{args.project}' is project {project_id}, "
+              f"but --project-id is {args.project_id}. Pass one of them.", file=sys.stderr)
+        sys.exit(1)
+
+
+def project_id_arg(api, args) -> str | None:
+    """The project ID from --project (resolved) or --project-id, whichever was given."""
+    if not args.project:
+        return args.project_id
+    project_id = resolve_project(api, args.project)
+    _check_project_agrees(args, project_id)
+    return project_id
+
+
+def read_ahead(pages, args):
+    """Prefetch pages for a listing read to the end; under --limit, fetch only on demand."""
+    return pages if getattr(args, 'limit', None) is not None else prefetch_pages(pages)
 
 
 def cmd_get_projects(args):
     """List all projects."""
     api = get_api()
-    projects = collect_paginated(api.get_projects())
-    output_json(projects)
+    output_json_stream(paged(iter_paginated(api.get_projects()), args))
 
 
 def cmd_get_sections(args):
@@ -78,16 +281,21 @@ def cmd_get_sections(args):
     api = get_api()
 
     # Resolve project name to ID if provided
-    project_id = args.project_id
-    if args.project:
-        project_id = resolve_project(api, args.project)
+    project_id = project_id_arg(api, args)
 
-    sections = collect_paginated(api.get_sections(project_id=project_id))
-    output_json(sections)
+    output_json_stream(paged(iter_paginated(api.get_sections(project_id=project_id)), args))
 
 
 def cmd_get_tasks(args):
     """List tasks with optional filters."""
+    # Validate the creation-date filter before any network call
+    if args.created_before and args.older_than:
+        print("Error: Cannot use both --older-than and --created-before", file=sys.stderr)
+        sys.exit(1)
+
+    cutoff = _date_cutoff(args)
+    created_before = _created_before(cutoff) if cutoff else None
+
     api = get_api()
 
     # Resolve project name to ID, keeping the project object for workspace detection
@@ -96,6 +304,7 @@ def cmd_get_tasks(args):
     if args.project:
         project_obj = resolve_project_object(api, args.project)
         project_id = project_obj.id
+        _check_project_agrees(args, project_id)
     elif args.project_id:
         # When using --project-id directly, fetch the project object for workspace detection
         try:
@@ -103,106 +312,188 @@ def cmd_get_tasks(args):
         except Exception:
             pass  # Will fail later on get_tasks if invalid
 
-    # Resolve section name to ID if provided
-    section_id = args.section_id
-    if args.section:
-        if not project_id:
-            print("Error: --section requires --project or --project-id", file=sys.stderr)
-            sys.exit(1)
-        section_id = resolve_section(api, project_id, args.section)
-
-    tasks = collect_paginated(api.get_tasks(
-        project_id=project_id,
-        section_id=section_id,
-        label=args.label
-    ))
-
-    # Fetch collaborators for shared projects (enrichment + explicit --assignee filtering)
-    collabs = []
-    assignee_map = {}
-    if project_id:
-        collabs = collect_paginated(api.get_collaborators(project_id))
-        if collabs:
-            assignee_map = {c.id: c.name for c in collabs}
+    if args.section and not project_id:
+        print("Error: --section requires --project or --project-id", file=sys.stderr)
+        sys.exit(1)
+    if args.assignee and not project_id:
+        print("Error: --assignee requires --project or --project-id to resolve collaborator", file=sys.stderr)
+        sys.exit(1)
+    if args.include_section_name and not project_id:
+        print("Warning: --include-section-name requires --project to work, ignoring", file=sys.stderr)
 
     # Determine if this is a team workspace project (workspace_id set)
     is_workspace_project = (
         project_obj is not None
         and getattr(project_obj, 'workspace_id', None) is not None
     )
+    auto_filter = is_workspace_project and not args.assignee and not getattr(args, 'team', False)
+    unassigned_only = getattr(args, 'unassigned', False)
+
+    # Collaborators, the section list and the current user depend only on
+    # project_id, not on each other: fetch them side by side so they cost one
+    # round trip, not three. The section list serves both --section and
+    # --include-section-name (resolve_section finds it memoized, so even a
+    # numeric section ID costs no GET of its own).
+    def fetch_collaborators():
+        return list_collaborators(api, project_id) if project_id else []
+
+    def fetch_sections():
+        wanted_sections = args.section or args.include_section_name
+        return list_sections(api, project_id) if project_id and wanted_sections else None
+
+    def fetch_user():
+        return get_current_user() if auto_filter and not unassigned_only else None
+
+    collabs, section_list, user = imap_concurrent(
+        lambda fetch: fetch(), [fetch_collaborators, fetch_sections, fetch_user]
+    )
 
-    # Assignee filtering: explicit --assignee, or auto-filter on workspace projects
+    # Collaborators for shared projects (enrichment + explicit --assignee filtering)
+    assignee_map = {c.id: c.name for c in collabs}
+
+    sections = None
+    if args.include_section_name and section_list is not None:
+        sections = {s.id: s.name for s in section_list}
+
+    # Resolve section name to ID if provided
+    section_id = args.section_id
+    if args.section:
+        section_id = resolve_section(api, project_id, args.section)
+
+    # Assignee filtering: explicit --assignee, or auto-filter on workspace projects.
+    # `wanted` is the assignee_id kept (None = unassigned); `notice` reports
+    # how many survived, on stderr, once the listing is done.
+    filter_assignee = False
+    wanted = None
+    notice = None
     if args.assignee:
-        if not project_id:
-            print("Error: --assignee requires --project or --project-id to resolve collaborator", file=sys.stderr)
-            sys.exit(1)
-        assignee_id = resolve_assignee(api, project_id, args.assignee)
-        tasks = [t for t in tasks if getattr(t, 'assignee_id', None) == assignee_id]
-    elif is_workspace_project and collabs and not getattr(args, 'team', False):
+        filter_assignee = True
+        wanted = resolve_assignee(api, project_id, args.assignee)
+    elif auto_filter and collabs:
         # Auto-filter workspace (team) projects to current user's tasks
-        user = get_current_user()
-        my_id = user['id']
-        if getattr(args, 'unassigned', False):
+        filter_assignee = True
+        if unassigned_only:
             # Triage mode: show unassigned tasks only
-            my_tasks = [t for t in tasks if getattr(t, 'assignee_id', None) is None]
-            excluded = len(tasks) - len(my_tasks)
-            if excluded > 0:
-                print(f"Showing {len(my_tasks)} unassigned tasks of {len(tasks)} total. Use --team for all.", file=sys.stderr)
+            def notice(kept, total):
+                return f"Showing {kept} unassigned tasks of {total} total. Use --team for all."
         else:
             # Default: assigned-to-me only (exclude unassigned)
-            my_tasks = [t for t in tasks if getattr(t, 'assignee_id', None) == my_id]
-            excluded = len(tasks) - len(my_tasks)
-            if excluded > 0:
-                print(f"Showing {len(my_tasks)} of {len(tasks)} tasks (assigned to {user['full_name']}). Use --unassigned for triage, --team for all.", file=sys.stderr)
-        tasks = my_tasks
+            wanted = user['id']
+
+            def notice(kept, total):
+                return f"Showing {kept} of {total} tasks (assigned to {user['full_name']}). Use --unassigned for triage, --team for all."
+
+    # With a date filter, let the server drop old tasks before they're paged
+    # over (filter endpoint); the scope get_tasks would apply is then
+    # re-checked here, since a filter query matches by name, not ID. Not when
+    # a notice will print: its "N of M" counts the whole project, which a
+    # date-filtered listing never sees.
+    query = None
+    if cutoff and notice is None and (project_obj is not None or not project_id):
+        section_name = None
+        if section_id and section_list:
+            section_name = next((s.name for s in section_list if s.id == section_id), None)
+        query = _filter_query(
+            cutoff,
+            project_name=project_obj.name if project_obj is not None else None,
+            section_name=section_name,
+            label=args.label,
+        )
+    label = args.label.lower() if args.label else None
 
-    # Filter by creation date if provided (client-side filter)
-    if args.created_before and args.older_than:
-        print("Error: Cannot use both --older-than and --created-before", file=sys.stderr)
-        sys.exit(1)
+    def in_scope(t):
+        return ((not project_id or t.project_id == project_id)
+                and (not section_id or t.section_id == section_id)
+                and (not label or label in (name.lower() for name in t.labels)))
 
-    if args.created_before or args.older_than:
-        def get_created(t):
-            ca = t.created_at
-            if isinstance(ca, str):
-                return datetime.fromisoformat(ca[:19])
-            return ca.replace(tzinfo=None)  # datetime object
-
-        if args.older_than:
-            match = re.match(r'(\d+)([dwm])', args.older_than)
-            if not match:
-                print("Error: --older-than format should be like '30d', '2w', or '3m'", file=sys.stderr)
-                sys.exit(1)
-            num, unit = int(match.group(1)), match.group(2)
-            days = num * {'d': 1, 'w': 7, 'm': 30}[unit]
-            cutoff = datetime.now() - timedelta(days=days)
-        else:
-            cutoff = datetime.fromisoformat(args.created_before + "T23:59:59")
-
-        tasks = [t for t in tasks if get_created(t) < cutoff]
-
-    # Enrich tasks with comments and assignee names
-    enriched = []
-    for t in tasks:
-        task_dict = to_dict(t)
-        # Resolve assignee_id to human-readable name
-        aid = task_dict.get('assignee_id')
-        task_dict['assignee_name'] = assignee_map.get(aid) if aid else None
-        comments = collect_paginated(api.get_comments(task_id=t.id))
-        task_dict['comments'] = [to_dict(c) for c in comments]
-        enriched.append(task_dict)
-
-    # Optionally include section names (requires extra API call)
-    if args.include_section_name:
-        if not project_id:
-            print("Warning: --include-section-name requires --project to work, ignoring", file=sys.stderr)
+    def task_pages():
+        if query:
+            try:
+                pages = iter(api.filter_tasks(query=query))
+                first = next(pages, [])
+            except Exception as e:
+                if http_status(e) != 400:
+                    raise
+                # Query rejected before anything was listed: use get_tasks
+            else:
+                yield first
+                yield from pages
+                return
+        yield from api.get_tasks(
+            project_id=project_id,
+            section_id=section_id,
+            label=args.label
+        )
+
+    counts = {"total": 0, "kept": 0}
+
+    # Single pass per task: scope, assignee and date checks run as each task
+    # streams in, so to_dict/comment fetches only ever see the survivors.
+    def keep(t):
+        if query and not in_scope(t):
+            return False
+        counts["total"] += 1
+        if filter_assignee:
+            if getattr(t, 'assignee_id', None) != wanted:
+                return False
+            counts["kept"] += 1
+        # Filter by creation date if provided (client-side filter)
+        return created_before is None or created_before(t)
+
+    def with_comments(t):
+        # One task's comments failing (after transport retries) shouldn't
+        # sink the whole listing: emit the task flagged comments_error and
+        # say so. comments stays a list, so `.comments[]` consumers keep
+        # working. A 401 still aborts — every other call would fail the same way.
+        try:
+            return t, collect_paginated(api.get_comments(task_id=t.id))
+        except Exception as e:
+            if http_status(e) == 401:
+                raise
+            print(f"Warning: could not fetch comments for task {t.id}: {e}", file=sys.stderr)
+            return t, None
+
+    # Pipeline: tasks stream in page by page; each kept task's comments are
+    # fetched concurrently while later pages load, and tasks are written in
+    # order as soon as their comments land. Every task is fetched, since
+    # attachment-only comments don't show in any count.
+    # --no-comments: one request per page instead of one more per task
+    no_comments = getattr(args, 'no_comments', False)
+
+    def enriched():
+        # Order: scope/assignee/date filters -> --offset/--limit -> enrichment.
+        # The slice counts tasks that pass the filters, and only the returned
+        # tasks get comments fetched and assignee/section names attached
+        # (the section map itself is one fetch, whatever the slice)
+        tasks = paged(filter(keep, iter_paginated(read_ahead(task_pages(), args))), args)
+        if no_comments:
+            pairs = ((t, None) for t in tasks)
         else:
-            sections = {s.id: s.name for s in collect_paginated(api.get_sections(project_id=project_id))}
-            for task_dict in enriched:
+            pairs = imap_concurrent(with_comments, tasks)
+        for t, comments in pairs:
+            task_dict = to_dict(t)
+            # Resolve assignee_id to human-readable name
+            aid = task_dict.get('assignee_id')
+            task_dict['assignee_name'] = assignee_map.get(aid) if aid else None
+            # Comment objects go out as-is: orjson walks them natively, and
+            # the stdlib fallback converts them via _json_default
+            if no_comments:
+                pass  # key omitted: "not fetched", unlike an empty list
+            elif comments is None:
+                task_dict['comments'] = []
+                task_dict['comments_error'] = True
+            else:
+                task_dict['comments'] = comments
+            if sections is not None:
                 sid = task_dict.get('section_id')
                 task_dict['section_name'] = sections.get(sid) if sid else None
+            yield task_dict
 
-    print(json.dumps(enriched, indent=2, default=str))
+    output_json_stream(enriched())
+
+    # A --limit can stop the listing early, leaving the counts partial
+    if notice and counts["kept"] < counts["total"] and getattr(args, 'limit', None) is None:
+        print(notice(counts["kept"], counts["total"]), file=sys.stderr)
 
 
 def cmd_get_task(args):
@@ -221,16 +512,15 @@ def cmd_get_task(args):
         task_dict['assignee_name'] = assignee_map.get(aid)
     else:
         task_dict['assignee_name'] = None
-    comments = collect_paginated(api.get_comments(task_id=args.id))
-    task_dict['comments'] = [to_dict(c) for c in comments]
-    print(json.dumps(task_dict, indent=2, default=str))
+    if not getattr(args, 'no_comments', False):
+        task_dict['comments'] = collect_paginated(api.get_comments(task_id=args.id))
+    output_json(task_dict)
 
 
 def cmd_filter_tasks(args):
     """Filter tasks using Todoist filter syntax."""
     api = get_api()
-    tasks = collect_paginated(api.filter_tasks(query=args.query))
-    output_json(tasks)
+    output_json_stream(paged(iter_paginated(read_ahead(api.filter_tasks(query=args.query), args)), args))
 
 
 def cmd_complete_task(args):
@@ -296,22 +586,20 @@ def cmd_get_completed(args):
     if args.project:
         filter_query = f"#{args.project}"
 
+    # Only the first page is fetched up front, so a bad query or date range
+    # still fails cleanly before any output; later pages stream as written
     try:
-        completed = list(api.get_completed_tasks_by_completion_date(
+        pages = iter(api.get_completed_tasks_by_completion_date(
             since=since,
             until=until,
             filter_query=filter_query
         ))
+        first = next(pages, [])
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Flatten batches
-    all_tasks = []
-    for batch in completed:
-        all_tasks.extend(batch)
-
-    output_json(all_tasks)
+    output_json_stream(iter_paginated(chain([first], prefetch_pages(pages))))
 
 
 def cmd_add_task(args):
@@ -319,9 +607,7 @@ def cmd_add_task(args):
     api = get_api()
 
     # Resolve project name to ID if provided
-    project_id = args.project_id
-    if args.project:
-        project_id = resolve_project(api, args.project)
+    project_id = project_id_arg(api, args)
 
     # Resolve section name to ID if provided
     section_id = args.section_id
@@ -346,55 +632,180 @@ def cmd_add_task(args):
     output_json(task)
 
 
+# Keys a node of an add-batch tree may carry; anything else is a typo that
+# would otherwise be silently dropped
+_BATCH_NODE_KEYS = {"content", "description", "labels", "priority", "due", "children"}
+
+
+def _check_task_tree(data, where: str = "input") -> list:
+    """
+    Validate an add-batch tree (one node or a list) before anything is created.
+
+    Exits with an error naming the offending node, so a malformed file never
+    leaves a half-built tree behind.
+    """
+    nodes = data if isinstance(data, list) else [data]
+    for i, node in enumerate(nodes):
+        path = f"{where}[{i}]"
+        problem = None
+        if not isinstance(node, dict):
+            problem = "must be an object"
+        elif not isinstance(node.get("content"), str) or not node["content"].strip():
+            problem = "needs a non-empty \"content\""
+        elif set(node) - _BATCH_NODE_KEYS:
+            problem = f"has unknown keys: {', '.join(sorted(set(node) - _BATCH_NODE_KEYS))}"
+        elif not isinstance(node.get("children", []), list):
+            problem = "\"children\" must be a list"
+        elif node.get("priority") is not None and (type(node["priority"]) is not int
+                                                   or not 1 <= node["priority"] <= 4):
+            problem = "\"priority\" must be a whole number from 1 to 4"
+        elif node.get("labels") is not None and (
+                not isinstance(node["labels"], list)
+                or not all(isinstance(label, str) for label in node["labels"])):
+            problem = "\"labels\" must be a list of strings"
+        else:
+            # null is as good as absent for the optional fields
+            wrong = [k for k in ("description", "due")
+                     if node.get(k) is not None and not isinstance(node[k], str)]
+            if wrong:
+                problem = f"\"{wrong[0]}\" must be a string"
+        if problem:
+            print(f"Error: {path} {problem}", file=sys.stderr)
+            sys.exit(1)
+        _check_task_tree(node.get("children", []), f"{path}.children")
+    return nodes
+
+
+def cmd_add_batch(args):
+    """Create a tree of tasks from JSON: each level in parallel once its parents exist."""
+    api = get_api()
+
+    if args.file:
+        try:
+            with open(args.file) as f:
+                text = f.read()
+        except OSError as e:
+            print(f"Error: cannot read {args.file}: {e.strerror}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        text = sys.stdin.read()
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        print(f"Error: invalid JSON: {e}", file=sys.stderr)
+        sys.exit(1)
+    roots = _check_task_tree(data)
+
+    project_id = project_id_arg(api, args)
+    section_id = args.section_id
+    if args.section:
+        if not project_id:
+            print("Error: --section requires --project or --project-id", file=sys.stderr)
+            sys.exit(1)
+        section_id = resolve_section(api, project_id, args.section)
+
+    def create(item):
+        node, parent_id, position, _ = item
+        if parent_id:
+            # Subtasks land in the parent's project and section. Siblings are
+            # created concurrently, so arrival order is arbitrary: an explicit
+            # order keeps them as listed.
+            placement = {"parent_id": parent_id, "order": position}
+        else:
+            placement = {"project_id": project_id, "section_id": section_id}
+        return api.add_task(
+            content=node["content"],
+            description=node.get("description"),
+            labels=node.get("labels"),
+            priority=node.get("priority"),
+            due_string=node.get("due"),
+            **placement,
+        )
+
+    # Depth-synchronous, breadth-parallel: a whole level goes out at once,
+    # so a tree costs one round trip per level rather than one per task.
+    # Roots are created one by one — they join an existing project or
+    # section, where only arrival order places them.
+    created = []
+    level = [(node, None, i, created) for i, node in enumerate(roots, start=1)]
+    done = 0
+    try:
+        while level:
+            results = imap_concurrent(create, level) if level[0][1] else map(create, level)
+            next_level = []
+            for (node, _, _, siblings), task in zip(level, results):
+                done += 1
+                entry = {"id": task.id, "content": task.content, "children": []}
+                siblings.append(entry)
+                next_level += [(child, task.id, i, entry["children"])
+                               for i, child in enumerate(node.get("children", []), start=1)]
+            level = next_level
+    except Exception:
+        # Report what landed so a retry doesn't duplicate it, then the error
+        # (siblings still in flight when it struck may exist too)
+        if done:
+            print(f"Created {done} task(s) before the failure:", file=sys.stderr)
+            print(_dumps(created), file=sys.stderr)
+        raise
+
+    output_json(created if isinstance(data, list) else created[0])
+
+
 def cmd_update_task(args):
     """Update an existing task."""
     api = get_api()
 
-    # Resolve project name to ID if provided
-    project_id = args.project_id
-    if args.project:
-        project_id = resolve_project(api, args.project)
-
     # --no-section: move to the project root. The API has no "clear section"
     # field — the only way out of a section is a move targeting project_id.
-    if args.no_section:
-        if args.section or args.section_id:
-            print("Error: --no-section cannot be combined with --section/--section-id", file=sys.stderr)
-            sys.exit(1)
-        if not project_id:
-            # Staying in the current project, just leaving the section
-            try:
-                task = api.get_task(args.id)
-            except Exception as e:
-                handle_task_not_found(e, args.id)
-            project_id = task.project_id
+    if args.no_section and (args.section or args.section_id):
+        print("Error: --no-section cannot be combined with --section/--section-id", file=sys.stderr)
+        sys.exit(1)
+
+    # --no-section or --section without a target project, and --assignee, need
+    # the task's current project. The task is fetched at most once, side by
+    # side with resolving a --project name: neither depends on the other.
+    needs_task = bool(args.assignee) or (
+        (args.no_section or args.section) and not (args.project or args.project_id)
+    )
+
+    def fetch_task():
+        if not needs_task:
+            return None
+        try:
+            return api.get_task(args.id)
+        except Exception as e:
+            handle_task_not_found(e, args.id)
+
+    def fetch_project_id():
+        return project_id_arg(api, args)
+
+    task, project_id = imap_concurrent(lambda fetch: fetch(), [fetch_task, fetch_project_id])
+
+    if args.no_section and not project_id:
+        # Staying in the current project, just leaving the section
+        project_id = task.project_id
+
+    # A section name resolves in the target project when moving, else in the
+    # task's current one; an assignee among the current project's
+    # collaborators. With both, warm the two lists concurrently.
+    section_project_id = project_id or (task.project_id if task else None)
+    if args.section and args.assignee:
+        for _ in imap_concurrent(lambda fetch: fetch(), [
+            lambda: list_sections(api, section_project_id),
+            lambda: list_collaborators(api, task.project_id),
+        ]):
+            pass
 
     # Resolve section name to ID if provided
     section_id = args.section_id
     if args.section:
-        # Need a project context to resolve section name
-        if project_id:
-            # Moving to new project - resolve section in target project
-            resolve_project_id = project_id
-        else:
-            # Not moving - resolve section in task's current project
-            try:
-                task = api.get_task(args.id)
-            except Exception as e:
-                handle_task_not_found(e, args.id)
-            resolve_project_id = task.project_id
-        section_id = resolve_section(api, resolve_project_id, args.section)
+        section_id = resolve_section(api, section_project_id, args.section)
 
     # Resolve assignee to ID if provided — same resolver as `tasks --assignee`,
     # so name, email, and the numeric id from `collaborators` all work, and an
     # ambiguous substring errors instead of silently picking the first hit
     assignee_id = None
     if args.assignee:
-        # Get task's project to look up collaborators
-        try:
-            task = api.get_task(args.id)
-        except Exception as e:
-            handle_task_not_found(e, args.id)
         assignee_id = resolve_assignee(api, task.project_id, args.assignee)
 
     # Separate update fields from move fields
@@ -428,21 +839,25 @@ def cmd_update_task(args):
         print("Error: No update parameters provided", file=sys.stderr)
         sys.exit(1)
 
-    # Perform move first (if needed), then update
+    # Perform move first (if needed), then update. Deliberately serial: run
+    # concurrently, update's response could predate the move (forcing a third
+    # GET, so no latency saved) and a move landing last would reset --order.
     if move_kwargs:
         try:
             api.move_task(args.id, **move_kwargs)
         except Exception as e:
-            error_str = str(e).lower()
-            if "404" in error_str or "not found" in error_str:
+            status = http_status(e)
+            if status == 404:
                 print(f"Error: Task '{args.id}' not found", file=sys.stderr)
                 sys.exit(1)
-            if "429" in str(e) or "rate limit" in error_str:
+            if status == 429:
                 print("Error: Rate limited by Todoist. Wait a moment and retry.", file=sys.stderr)
                 sys.exit(1)
-            if "400" in str(e):
-                # Try to give specific error messages for common 400 causes
-                if "workspace" in error_str or "project_id" in error_str:
+            if status == 400:
+                # Try to give specific error messages for common 400 causes;
+                # the reason is in the response body, not the exception text
+                body = e.response.text.lower()
+                if "workspace" in body or "project_id" in body:
                     print("Error: Cannot move task between workspaces (personal ↔ team).", file=sys.stderr)
                     print("Workaround: Complete the task and recreate it in the target project.", file=sys.stderr)
                 else:
@@ -451,17 +866,20 @@ def cmd_update_task(args):
                 sys.exit(1)
             raise
 
+    # update_task returns the task as it stands after both calls, so only a
+    # move-only edit (move_task returns a bare bool) needs a re-fetch
+    task = None
     if update_kwargs:
         try:
-            api.update_task(args.id, **update_kwargs)
+            task = api.update_task(args.id, **update_kwargs)
         except Exception as e:
             handle_task_not_found(e, args.id)
 
-    # Fetch and show the updated task
-    try:
-        task = api.get_task(args.id)
-    except Exception as e:
-        handle_task_not_found(e, args.id)
+    if task is None:
+        try:
+            task = api.get_task(args.id)
+        except Exception as e:
+            handle_task_not_found(e, args.id)
     output_json(task)
 
 
@@ -490,9 +908,7 @@ def cmd_add_section(args):
     api = get_api()
 
     # Resolve project name to ID if provided
-    project_id = args.project_id
-    if args.project:
-        project_id = resolve_project(api, args.project)
+    project_id = project_id_arg(api, args)
 
     if not project_id:
         print("Error: --project-id or --project is required for add-section", file=sys.stderr)
@@ -502,6 +918,7 @@ def cmd_add_section(args):
         name=args.name,
         project_id=project_id
     )
+    names_changed()
     output_json(section)
 
 
@@ -513,11 +930,10 @@ def cmd_get_comments(args):
         print("Error: --task-id or --project-id is required", file=sys.stderr)
         sys.exit(1)
 
-    comments = collect_paginated(api.get_comments(
+    output_json_stream(paged(iter_paginated(api.get_comments(
         task_id=args.task_id,
         project_id=args.project_id
-    ))
-    output_json(comments)
+    )), args))
 
 
 def cmd_get_collaborators(args):
@@ -528,8 +944,7 @@ def cmd_get_collaborators(args):
         print("Error: --project-id is required", file=sys.stderr)
         sys.exit(1)
 
-    collaborators = collect_paginated(api.get_collaborators(args.project_id))
-    output_json(collaborators)
+    output_json_stream(iter_paginated(api.get_collaborators(args.project_id)))
 
 
 def cmd_auth(args):
@@ -542,7 +957,7 @@ def cmd_auth(args):
         sys.exit(0 if status["authenticated"] else 1)
 
     if args.token:
-        success = store_api_token(args.token)
+        success = store_api_token(args.token, force=args.force)
         sys.exit(0 if success else 1)
 
     # No flags: print setup instructions
@@ -551,10 +966,6 @@ def cmd_auth(args):
 
 def cmd_doctor(args):
     """Check CLI setup and diagnose issues."""
-    import os
-    import shutil
-    from pathlib import Path
-
     checks_passed = 0
     checks_failed = 0
 
@@ -582,15 +993,22 @@ def cmd_doctor(args):
 
     # Dependencies
     print("\n[Dependencies]")
+    # A real import, not just a lookup: an installed package whose own
+    # dependencies are broken must fail here, with the reason
     for pkg in ["todoist_api_python", "httpx"]:
         try:
             __import__(pkg)
             check(pkg, True)
-        except ImportError:
-            check(pkg, False, f"pip install {pkg.replace('_', '-')}")
+        except ImportError as e:
+            if e.name == pkg:
+                check(pkg, False, f"pip install {pkg.replace('_', '-')}")
+            else:
+                check(pkg, False, f"installed but fails to import: {e}")
 
     # Installation
     print("\n[Installation]")
+    import shutil
+
     accomplis_shim = shutil.which("accomplis")
     check(
         "accomplis on PATH",
@@ -606,7 +1024,8 @@ def cmd_doctor(args):
     # Auth
     print("\n[Authentication]")
     from accomplis.auth import get_auth_status
-    status = get_auth_status()
+    # Always a live check: doctor is what you run when something is wrong
+    status = get_auth_status(use_cache=False)
     check(
         "Todoist authenticated",
         status["authenticated"],
@@ -646,6 +1065,7 @@ def cmd_add_project(args):
         kwargs["is_favorite"] = True
 
     project = api.add_project(**kwargs)
+    names_changed()
     output_json(project)
 
 
@@ -668,6 +1088,7 @@ def cmd_update_project(args):
         sys.exit(1)
 
     project = api.update_project(project_id, **kwargs)
+    names_changed()
     output_json(project)
 
 
@@ -675,48 +1096,69 @@ def cmd_whoami(args):
     """Show the current authenticated user."""
     user = get_current_user()
     if args.json:
-        print(json.dumps(user, indent=2, default=str))
+        output_json(user)
     else:
         print(f"{user['full_name']} <{user['email']}> (id: {user['id']})")
 
 
-def cmd_version(args):
-    """Show version and commit info."""
+def package_version() -> str:
+    """Installed accomplis version, or "dev" when running from a source tree."""
     from importlib.metadata import version as pkg_version, PackageNotFoundError
 
-    # Get package version
     try:
-        ver = pkg_version("accomplis")
+        return pkg_version("accomplis")
     except PackageNotFoundError:
-        ver = "dev"
+        return "dev"
+
 
-    print(f"accomplis {ver}")
+class VersionAction(argparse.Action):
+    """--version that reads package metadata only when the flag is given.
+
+    argparse's built-in action needs the string up front, which put a
+    metadata lookup (a scan of installed distributions) on every invocation.
+    """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS,
+                 help="show program's version number and exit"):
+        super().__init__(option_strings=option_strings, dest=dest, default=default,
+                         nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(f"accomplis {package_version()}")
+        parser.exit()
+
+
+def cmd_version(args):
+    """Show version and commit info."""
+    print(f"accomplis {package_version()}")
     print(f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}")
 
 
-def main():
-    from importlib.metadata import version as pkg_version
-    parser = argparse.ArgumentParser(
-        description="Todoist CLI - MCP-free interface using official Python SDK",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    parser.add_argument('--version', '-V', action='version',
-                        version=f'accomplis {pkg_version("accomplis")}')
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+def _non_negative(value):
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or more, got {n}")
+    return n
+
 
-    # Auth command
-    p = subparsers.add_parser("auth", help="Authenticate with Todoist")
+def _paging_args(p):
+    p.add_argument("--limit", type=_non_negative, help="Return at most N items")
+    p.add_argument("--offset", type=_non_negative, default=0, help="Skip the first N items")
+
+
+def _auth_args(p):
     p.add_argument("--token", help="API token to store (get from Todoist settings)")
     p.add_argument("--status", action="store_true", help="Check authentication status")
+    p.add_argument("--force", action="store_true", help="With --token: rewrite the token even if it's already stored")
 
-    # Natural command names (primary)
-    subparsers.add_parser("projects", help="List all projects")
 
-    p = subparsers.add_parser("sections", help="List sections")
+def _sections_args(p):
     p.add_argument("--project-id", help="Filter by project ID")
     p.add_argument("--project", help="Filter by project name (e.g., 'Desired Outcomes Q4')")
+    _paging_args(p)
 
-    p = subparsers.add_parser("tasks", help="List tasks")
+
+def _tasks_args(p):
     p.add_argument("--project-id", help="Filter by project ID")
     p.add_argument("--project", help="Filter by project name (e.g., '@Wait')")
     p.add_argument("--section-id", help="Filter by section ID")
@@ -728,29 +1170,36 @@ def main():
     p.add_argument("--team", action="store_true", help="Show all team members' tasks (default: only yours on workspace projects)")
     p.add_argument("--unassigned", action="store_true", help="Show unassigned tasks for triage (workspace projects only)")
     p.add_argument("--include-section-name", action="store_true", help="Include section name in output")
+    p.add_argument("--no-comments", action="store_true", help="Skip fetching comments (much faster on large projects; output has no comments key)")
+    _paging_args(p)
+
 
-    p = subparsers.add_parser("task", help="Get a single task")
+def _task_id_args(p):
     p.add_argument("id", help="Task ID")
 
-    p = subparsers.add_parser("filter", help="Filter tasks using Todoist filter syntax")
+
+def _task_args(p):
+    _task_id_args(p)
+    p.add_argument("--no-comments", action="store_true", help="Skip fetching comments (output has no comments key)")
+
+
+def _filter_args(p):
     p.add_argument("query", help="Filter query (e.g., 'today', 'overdue', '#project')")
+    _paging_args(p)
 
-    p = subparsers.add_parser("done", help="Complete a task")
-    p.add_argument("id", help="Task ID")
-    p.add_argument("--note", help="Closing note appended to the task description before completing")
 
-    p = subparsers.add_parser("delete", help="Delete a task (works on completed tasks too)")
+def _done_args(p):
     p.add_argument("id", help="Task ID")
+    p.add_argument("--note", help="Closing note appended to the task description before completing")
 
-    p = subparsers.add_parser("uncomplete", help="Uncomplete/reopen a task")
-    p.add_argument("id", help="Task ID")
 
-    p = subparsers.add_parser("completed", help="List completed tasks")
+def _completed_args(p):
     p.add_argument("--since", help="Start date (YYYY-MM-DD), default: 7 days ago")
     p.add_argument("--until", help="End date (YYYY-MM-DD), default: now")
     p.add_argument("--project", help="Filter by project name")
 
-    p = subparsers.add_parser("add", help="Create a new task")
+
+def _add_args(p):
     p.add_argument("content", help="Task content/title")
     p.add_argument("--description", help="Task description")
     p.add_argument("--project-id", help="Project ID")
@@ -762,7 +1211,16 @@ def main():
     p.add_argument("--priority", type=int, choices=[1, 2, 3, 4], help="Priority (1=normal, 4=urgent)")
     p.add_argument("--due", help="Due date in natural language")
 
-    p = subparsers.add_parser("update", help="Update an existing task")
+
+def _add_batch_args(p):
+    p.add_argument("--file", help="JSON tree to create (default: read stdin)")
+    p.add_argument("--project-id", help="Project ID for the top-level tasks")
+    p.add_argument("--project", help="Project by name for the top-level tasks")
+    p.add_argument("--section-id", help="Section ID for the top-level tasks")
+    p.add_argument("--section", help="Section by name - requires --project")
+
+
+def _update_args(p):
     p.add_argument("id", help="Task ID")
     p.add_argument("--content", help="New task content/title")
     p.add_argument("--description", help="New description (use '' to clear)")
@@ -777,103 +1235,199 @@ def main():
     p.add_argument("--assignee", help="Reassign to collaborator by name")
     p.add_argument("--due", help="Due date in natural language")
 
-    p = subparsers.add_parser("reorder", help="Set task order to the sequence given (first = top)")
+
+def _reorder_args(p):
     p.add_argument("ids", nargs="+", help="Task IDs in desired order. Unlisted siblings keep their old order and may interleave — list every task in the section for a full arrangement")
 
-    p = subparsers.add_parser("comments", help="Get comments")
+
+def _comments_args(p):
     p.add_argument("--task-id", help="Task ID")
     p.add_argument("--project-id", help="Project ID")
+    _paging_args(p)
+
 
-    p = subparsers.add_parser("collaborators", help="Get project collaborators")
+def _collaborators_args(p):
     p.add_argument("--project-id", required=True, help="Project ID")
 
-    p = subparsers.add_parser("add-project", help="Create a new project")
+
+def _add_project_args(p):
     p.add_argument("name", help="Project name")
     p.add_argument("--parent", help="Parent project name or ID (for nested projects)")
     p.add_argument("--color", help="Project color (e.g., 'berry_red', 'blue', 'green')")
     p.add_argument("--favorite", action="store_true", help="Mark as favorite")
 
-    p = subparsers.add_parser("update-project", help="Update a project (rename, recolor, etc.)")
+
+def _update_project_args(p):
     p.add_argument("project", help="Project name or ID to update")
     p.add_argument("--name", help="New project name")
     p.add_argument("--color", help="New project color")
     p.add_argument("--favorite", action=argparse.BooleanOptionalAction, help="Set/unset favorite")
 
-    p = subparsers.add_parser("add-section", help="Create a new section (outcome)")
+
+def _add_section_args(p):
     p.add_argument("name", help="Section name")
     p.add_argument("--project-id", help="Project ID")
     p.add_argument("--project", help="Project by name (e.g., 'Desired Outcomes Q1')")
 
-    # Utility commands
-    p = subparsers.add_parser("whoami", help="Show current authenticated user")
+
+def _whoami_args(p):
     p.add_argument("--json", action="store_true", help="Output full user object as JSON")
 
-    subparsers.add_parser("doctor", help="Check CLI setup and diagnose issues")
-    subparsers.add_parser("version", help="Show version and commit info")
 
-    args = parser.parse_args()
+# (command, help, argument builder) in --help order
+SUBCOMMANDS = [
+    ("auth", "Authenticate with Todoist", _auth_args),
+    # Natural command names (primary)
+    ("projects", "List all projects", _paging_args),
+    ("sections", "List sections", _sections_args),
+    ("tasks", "List tasks", _tasks_args),
+    ("task", "Get a single task", _task_args),
+    ("filter", "Filter tasks using Todoist filter syntax", _filter_args),
+    ("done", "Complete a task", _done_args),
+    ("delete", "Delete a task (works on completed tasks too)", _task_id_args),
+    ("uncomplete", "Uncomplete/reopen a task", _task_id_args),
+    ("completed", "List completed tasks", _completed_args),
+    ("add", "Create a new task", _add_args),
+    ("add-batch", "Create a task tree from JSON (parent + subtasks)", _add_batch_args),
+    ("update", "Update an existing task", _update_args),
+    ("reorder", "Set task order to the sequence given (first = top)", _reorder_args),
+    ("comments", "Get comments", _comments_args),
+    ("collaborators", "Get project collaborators", _collaborators_args),
+    ("add-project", "Create a new project", _add_project_args),
+    ("update-project", "Update a project (rename, recolor, etc.)", _update_project_args),
+    ("add-section", "Create a new section (outcome)", _add_section_args),
+    # Utility commands
+    ("whoami", "Show current authenticated user", _whoami_args),
+    ("doctor", "Check CLI setup and diagnose issues", None),
+    ("version", "Show version and commit info", None),
+    ("daemon", "Serve commands from one warm process (use with ACCOMPLIS_DAEMON=1)", None),
+]
+
+
+def cmd_daemon(args):
+    """Serve forwarded commands over a Unix socket until interrupted."""
+    from accomplis.daemon import serve
+
+    serve()
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    invoked = next((a for a in argv if not a.startswith("-")), None)
+
+    # Daemon mode (see daemon.py): hand the call to a warm process if one is
+    # listening, else fall through and run it here
+    if os.environ.get("ACCOMPLIS_DAEMON") and invoked:
+        from accomplis.daemon import LOCAL_COMMANDS, forward
+
+        if invoked not in LOCAL_COMMANDS:
+            code = forward(argv)
+            if code is not None:
+                sys.exit(code)
+
+    parser = argparse.ArgumentParser(
+        description="Todoist CLI - MCP-free interface using official Python SDK",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--version', '-V', action=VersionAction)
+    parser.add_argument('--refresh-cache', action='store_true',
+                        help="Re-fetch project/section names instead of using the 10-minute cache")
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    # Every command is registered (name + help is all top-level --help shows),
+    # but only the invoked one gets its arguments built — the rest would be
+    # ~80 add_argument calls thrown away on every run.
+    for name, help_text, add_arguments in SUBCOMMANDS:
+        p = subparsers.add_parser(name, help=help_text)
+        if add_arguments and name == invoked:
+            add_arguments(p)
+
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
+    if args.refresh_cache:
+        names_changed()
+
     # Dispatch to command handler
-    commands = {
-        "auth": cmd_auth,
-        "projects": cmd_get_projects,
-        "sections": cmd_get_sections,
-        "tasks": cmd_get_tasks,
-        "task": cmd_get_task,
-        "filter": cmd_filter_tasks,
-        "done": cmd_complete_task,
-        "delete": cmd_delete_task,
-        "uncomplete": cmd_uncomplete_task,
-        "completed": cmd_get_completed,
-        "add": cmd_add_task,
-        "update": cmd_update_task,
-        "reorder": cmd_reorder,
-        "add-project": cmd_add_project,
-        "update-project": cmd_update_project,
-        "add-section": cmd_add_section,
-        "comments": cmd_get_comments,
-        "collaborators": cmd_get_collaborators,
-        "whoami": cmd_whoami,
-        "doctor": cmd_doctor,
-        "version": cmd_version,
-    }
-
-    handler = commands.get(args.command)
-    if handler:
-        try:
-            handler(args)
-        except Exception as e:
-            # Catch network errors globally
-            error_name = type(e).__name__
-            error_str = str(e).lower()
-
-            # Timeout errors
-            if "timeout" in error_name.lower() or "timeout" in error_str:
-                print(f"Error: Request timed out after {DEFAULT_TIMEOUT}s", file=sys.stderr)
-                print("Check your network connection or try again.", file=sys.stderr)
-                sys.exit(1)
+    match args.command:
+        case "auth":
+            handler = cmd_auth
+        case "projects":
+            handler = cmd_get_projects
+        case "sections":
+            handler = cmd_get_sections
+        case "tasks":
+            handler = cmd_get_tasks
+        case "task":
+            handler = cmd_get_task
+        case "filter":
+            handler = cmd_filter_tasks
+        case "done":
+            handler = cmd_complete_task
+        case "delete":
+            handler = cmd_delete_task
+        case "uncomplete":
+            handler = cmd_uncomplete_task
+        case "completed":
+            handler = cmd_get_completed
+        case "add":
+            handler = cmd_add_task
+        case "add-batch":
+            handler = cmd_add_batch
+        case "update":
+            handler = cmd_update_task
+        case "reorder":
+            handler = cmd_reorder
+        case "add-project":
+            handler = cmd_add_project
+        case "update-project":
+            handler = cmd_update_project
+        case "add-section":
+            handler = cmd_add_section
+        case "comments":
+            handler = cmd_get_comments
+        case "collaborators":
+            handler = cmd_get_collaborators
+        case "whoami":
+            handler = cmd_whoami
+        case "doctor":
+            handler = cmd_doctor
+        case "version":
+            handler = cmd_version
+        case "daemon":
+            handler = cmd_daemon
+        case _:
+            print(f"Unknown command: {args.command}", file=sys.stderr)
+            sys.exit(1)
 
-            # Connection errors
-            if "connect" in error_name.lower() or "connection" in error_str:
-                print("Error: Could not connect to Todoist", file=sys.stderr)
-                print("Check your network connection.", file=sys.stderr)
-                sys.exit(1)
+    try:
+        handler(args)
+    except Exception as e:
+        # Catch network errors globally (httpx is loaded by any API call)
+        import httpx
 
-            # Token expired/revoked (401 Unauthorized)
-            if "401" in str(e) or "unauthorized" in error_str:
-                print("Error: Token expired or revoked.", file=sys.stderr)
-                print("Run 'accomplis auth' to re-authenticate.", file=sys.stderr)
-                sys.exit(1)
+        # Timeout errors
+        if isinstance(e, httpx.TimeoutException):
+            print(f"Error: Request timed out after {DEFAULT_TIMEOUT}s", file=sys.stderr)
+            print("Check your network connection or try again.", file=sys.stderr)
+            sys.exit(1)
 
-            # Re-raise unknown errors
-            raise
-    else:
-        print(f"Unknown command: {args.command}", file=sys.stderr)
-        sys.exit(1)
+        # Connection errors (refused, reset, DNS)
+        if isinstance(e, httpx.NetworkError):
+            print("Error: Could not connect to Todoist", file=sys.stderr)
+            print("Check your network connection.", file=sys.stderr)
+            sys.exit(1)
+
+        # Token expired/revoked (401 Unauthorized)
+        if http_status(e) == 401:
+            print("Error: Token expired or revoked.", file=sys.stderr)
+            print("Run 'accomplis auth' to re-authenticate.", file=sys.stderr)
+            sys.exit(1)
+
+        # Re-raise unknown errors
+        raise
 
 
 if __name__ == "__main__":
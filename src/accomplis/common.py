@@ -8,20 +8,33 @@ Provides common functions used across cli.py and flatten.py:
 - Object serialization
 """
 
+import atexit
+import random
+import re
 import sys
 import time
+from collections import deque
+from importlib.util import find_spec
 from typing import Any, Callable
+from weakref import WeakKeyDictionary
+
+from accomplis import name_cache
 
 # Lazy imports to allow --help without SDK installed
 TodoistAPI = None
 
 # Configuration
 DEFAULT_TIMEOUT = 30  # seconds
+PROBE_CONNECT_TIMEOUT = 3.05  # seconds; token checks fail fast when offline
+PROBE_READ_TIMEOUT = 10  # seconds
 RATE_LIMIT_DELAY = 0.2  # seconds between API calls
 RATE_LIMIT_RETRY_DELAY = 5  # seconds to wait after 429
 MAX_RETRIES = 3
 RETRY_BACKOFF_BASE = 1.0  # seconds; doubles per retry, plus jitter
 RETRY_AFTER_CAP = 30  # seconds; ceiling on server-requested Retry-After waits
+MAX_CONCURRENCY = 10  # parallel requests per fan-out; keeps bursts clear of 429s
+POOL_SIZE = 20  # pooled connections to api.todoist.com
+KEEPALIVE_EXPIRY = 30  # seconds an idle pooled connection stays open
 
 # Which (method, status) pairs are safe to replay. 429 and 503 mean the request
 # was rejected before processing (rate limit / load shedding), so any method can
@@ -41,8 +54,6 @@ def _should_retry(method: str, status: int) -> bool:
 
 def _retry_wait(retry_after: str | None, backoff: float) -> float:
     """Server-directed wait when Retry-After is present (capped), else backoff+jitter."""
-    import random
-
     if retry_after:
         try:
             return min(float(retry_after), RETRY_AFTER_CAP)
@@ -67,7 +78,19 @@ def make_retry_transport(inner=None, sleep=time.sleep):
 
     class _RetryTransport(httpx.BaseTransport):
         def __init__(self):
-            self._inner = inner or httpx.HTTPTransport(retries=MAX_RETRIES)
+            # Pool limits and http2 live here, not on the Client: httpx
+            # ignores both once a custom transport is supplied. HTTP/2 lets
+            # the comment fan-out share one TLS connection; it needs the
+            # optional h2 package, without which we stay on HTTP/1.1.
+            self._inner = inner or httpx.HTTPTransport(
+                retries=MAX_RETRIES,
+                http2=find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=POOL_SIZE,
+                    max_keepalive_connections=POOL_SIZE,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+            )
 
         def handle_request(self, request):
             request.read()  # materialise the body so a replay resends it
@@ -103,14 +126,31 @@ def _build_client():
     return httpx.Client(timeout=DEFAULT_TIMEOUT, transport=make_retry_transport())
 
 
+# One pooled client per process: the SDK and get_current_user share its
+# keep-alive connections, so only the first request pays TCP + TLS setup.
+_SESSION = None
+_API = None
+_API_TOKEN = None
+
+
+def _session():
+    """The process-wide pooled client, built on first use and closed at exit."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = _build_client()
+        atexit.register(_SESSION.close)
+    return _SESSION
+
+
 def get_api():
     """
     Get authenticated TodoistAPI instance with timeout and retry.
 
     todoist-api-python v4 switched from requests to httpx internally.
-    We pass an httpx.Client with timeout and retry transport.
+    We pass the shared pooled client (timeout + retry transport), and memoize
+    the instance per token so repeated calls reuse it.
     """
-    global TodoistAPI
+    global TodoistAPI, _API, _API_TOKEN
     if TodoistAPI is None:
         try:
             from todoist_api_python.api import TodoistAPI as API
@@ -123,7 +163,10 @@ def get_api():
     from accomplis.token_store import get_token
 
     token = get_token()
-    return TodoistAPI(token, client=_build_client())
+    if _API is None or _API_TOKEN != token:
+        _API = TodoistAPI(token, client=_session())
+        _API_TOKEN = token
+    return _API
 
 
 def get_current_user() -> dict:
@@ -136,30 +179,250 @@ def get_current_user() -> dict:
     from accomplis.token_store import get_token
 
     token = get_token()
-    with _build_client() as client:
-        resp = client.get(
-            "https://api.todoist.com/api/v1/user",
-            headers={"Authorization": f"Bearer {token}"},
-        )
+    resp = _session().get(
+        "https://api.todoist.com/api/v1/user",
+        headers={"Authorization": f"Bearer {token}"},
+    )
     resp.raise_for_status()
     return resp.json()
 
 
-def collect_paginated(iterator) -> list:
-    """Collect all items from a paginated SDK iterator."""
-    items = []
+def verify_token(token: str):
+    """
+    Check a token with the smallest authenticated request there is.
+
+    One project (limit=1) over the shared pooled client: no SDK import, and
+    the response is a few hundred bytes however many projects exist. Raises
+    httpx.HTTPStatusError if the token is rejected. Timeouts are short: a
+    stalled status check should report "could not verify", not hang.
+    """
+    import httpx
+
+    resp = _session().get(
+        "https://api.todoist.com/api/v1/projects",
+        params={"limit": 1},
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=httpx.Timeout(PROBE_READ_TIMEOUT, connect=PROBE_CONNECT_TIMEOUT),
+    )
+    resp.raise_for_status()
+
+
+def iter_paginated(iterator):
+    """Yield items from a paginated SDK iterator, fetching pages as consumed."""
     for batch in iterator:
+        yield from batch
+
+
+_EXHAUSTED = object()
+
+
+def prefetch_pages(pages):
+    """
+    Iterate `pages` with the next page already being fetched in the background.
+
+    While one page is processed and written, the next request is in flight,
+    so a long listing costs max(fetch, process) per page rather than the sum.
+    Cursor pagination is serial (each cursor comes from the page before), so
+    one page of lookahead is all the overlap there is. Stopping early still
+    waits for that one in-flight fetch: use it where the listing is read to
+    the end, not under --limit.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    pages = iter(pages)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(next, pages, _EXHAUSTED)
+        while (page := pending.result()) is not _EXHAUSTED:
+            pending = pool.submit(next, pages, _EXHAUSTED)
+            yield page
+
+
+def collect_paginated(iterator) -> list:
+    """
+    Collect all items from a paginated SDK iterator.
+
+    A lone page (the usual case for projects, sections, collaborators) is
+    returned as the SDK built it, without copying.
+    """
+    pages = iter(iterator)
+    first = next(pages, [])
+    second = next(pages, None)
+    if second is None:
+        return first if isinstance(first, list) else list(first)
+    items = list(first)
+    items.extend(second)
+    for batch in pages:
         items.extend(batch)
     return items
 
 
+def imap_concurrent(func: Callable, items, max_workers: int = MAX_CONCURRENCY):
+    """
+    Apply func to each item on a bounded thread pool, yielding results in order.
+
+    For per-item API fan-out (e.g. comments for each task): N round trips cost
+    roughly max(RTT) instead of sum(RTT). `items` is consumed lazily, so when
+    it is itself paginating, work on one page overlaps fetching the next, and
+    each result is yielded as soon as it and everything before it is done.
+    At most 2 * max_workers items are in flight or waiting to be yielded, so
+    a long listing streams in bounded memory rather than being read whole.
+    The SDK client is synchronous and the retry transport applies per
+    request, so a 429 inside the burst backs off on its own thread. The first
+    exception propagates to the caller and cancels work not yet started.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    pending = deque()
+    try:
+        for item in items:
+            # Backpressure: don't pull more items than the consumer is taking
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+            pending.append(pool.submit(func, item))
+            while pending and pending[0].done():
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# Per-invocation memo of list fetches, keyed by API instance: resolving a
+# project and then a section in it, or resolving a section and later listing
+# section names, must not re-paginate the same endpoint. Weak keys, so an
+# entry lives exactly as long as its client.
+_FETCH_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def clear_fetch_cache():
+    """Forget every memoized list, e.g. between requests to a long-lived process."""
+    _FETCH_CACHE.clear()
+
+
+def _cached_fetch(api, key: tuple, fetch: Callable) -> list:
+    per_api = _FETCH_CACHE.setdefault(api, {})
+    if key not in per_api:
+        per_api[key] = fetch()
+    return per_api[key]
+
+
+# Shape of an API v1 project/section ID ("6Jf8VQXxpwv56VQ7"): 16 letters
+# and digits, at least one of each. Anything else is treated as a name.
+_ID_RE = re.compile(r"(?=.*\d)(?=.*[A-Za-z])[A-Za-z0-9]{16}")
+
+
+def _get_by_id(api, key: tuple, getter: Callable, item_id: str):
+    """
+    Single-item GET for an ID-shaped argument, or None to fall back to a scan.
+
+    One request instead of paginating the whole list — unless that list is
+    already memoized, when the scan costs nothing. A 400/404 also returns
+    None, so a name that happens to look like an ID still resolves by name;
+    any other failure (401, timeout) propagates.
+    """
+    if not _ID_RE.fullmatch(item_id) or key in _FETCH_CACHE.get(api, {}):
+        return None
+    try:
+        return getter(item_id)
+    except Exception as e:
+        if http_status(e) in (400, 404):
+            return None
+        raise
+
+
+def list_projects(api) -> list:
+    """All projects, fetched once per API instance."""
+    return _cached_fetch(api, ("projects",), lambda: collect_paginated(api.get_projects()))
+
+
+def list_sections(api, project_id: str) -> list:
+    """All sections of a project, fetched once per API instance."""
+    return _cached_fetch(
+        api, ("sections", project_id),
+        lambda: collect_paginated(api.get_sections(project_id=project_id)),
+    )
+
+
+def list_collaborators(api, project_id: str) -> list:
+    """All collaborators on a project, fetched once per API instance."""
+    return _cached_fetch(
+        api, ("collaborators", project_id),
+        lambda: collect_paginated(api.get_collaborators(project_id)),
+    )
+
+
+def _index_by(items: list, key: Callable) -> dict:
+    """Map key(item) -> item in one pass; the first item wins on a repeated key."""
+    index = {}
+    for item in items:
+        index.setdefault(key(item), item)
+    return index
+
+
+def _index(api, key: tuple, field: str, key_fn: Callable) -> dict:
+    """
+    _index_by over the list memoized under `key`, built once per field.
+
+    Repeated resolves in one process (an update resolving project and
+    section, a script making many calls) reuse the dict instead of
+    re-lowercasing every name.
+    """
+    return _cached_fetch(api, (*key, field), lambda: _index_by(_FETCH_CACHE[api][key], key_fn))
+
+
+def _public_attrs(obj: Any) -> dict:
+    if hasattr(obj, 'to_dict'):  # set on the instance, not the class
+        return obj.to_dict()
+    return {k: v for k, v in obj.__dict__.items() if not k.startswith('_')}
+
+
+def _to_dict_strategy(cls: type) -> Callable:
+    """Decide once per type how to_dict converts its instances."""
+    if callable(getattr(cls, 'to_dict', None)):
+        return cls.to_dict  # SDK models
+    if not cls.__dictoffset__:
+        return lambda obj: obj  # dicts, primitives: no instance __dict__
+    # Attributes live per instance, so nothing more can be precomputed
+    return _public_attrs
+
+
+# Conversion strategy per type. to_dict runs once per task and comment on
+# every listing; the hasattr probing happens once per type instead.
+_TO_DICT_CACHE: dict[type, Callable] = {}
+
+
 def to_dict(obj: Any) -> dict:
     """Convert SDK object to dict for JSON output."""
-    if hasattr(obj, 'to_dict'):
-        return obj.to_dict()
-    if hasattr(obj, '__dict__'):
-        return {k: v for k, v in obj.__dict__.items() if not k.startswith('_')}
-    return obj
+    convert = _TO_DICT_CACHE.get(type(obj))
+    if convert is None:
+        convert = _TO_DICT_CACHE[type(obj)] = _to_dict_strategy(type(obj))
+    return convert(obj)
+
+
+def _disk_token(api) -> str | None:
+    """The token to key the name cache by — only for the real client, never a stand-in."""
+    return _API_TOKEN if api is _API else None
+
+
+def _names(api, key: tuple, cache_key: str) -> dict:
+    """
+    _index by lowercased name, written to the disk name cache when first built.
+
+    The list under `key` must already be memoized.
+    """
+    fresh = (*key, "name") not in _FETCH_CACHE.get(api, {})
+    index = _index(api, key, "name", lambda item: item.name.lower())
+    if fresh:
+        name_cache.remember(_disk_token(api), cache_key,
+                            {name: item.id for name, item in index.items()})
+    return index
+
+
+def names_changed():
+    """Forget cached names, on disk and in memory, after a create or rename."""
+    name_cache.forget()
+    clear_fetch_cache()
 
 
 def resolve_project(api, name_or_id: str) -> str:
@@ -168,18 +431,21 @@ def resolve_project(api, name_or_id: str) -> str:
 
     Returns project ID string. Exits with error if not found.
     """
-    projects = collect_paginated(api.get_projects())
-    name_lower = name_or_id.lower()
+    cached = name_cache.lookup(_disk_token(api), "projects", name_or_id)
+    if cached:
+        return cached
+
+    project = _get_by_id(api, ("projects",), api.get_project, name_or_id)
+    if project:
+        return project.id
 
-    # Try name lookup
-    for p in projects:
-        if p.name.lower() == name_lower:
-            return p.id
+    projects = list_projects(api)
 
-    # Try ID lookup
-    for p in projects:
-        if p.id == name_or_id:
-            return p.id
+    # Name first, then ID
+    match = (_names(api, ("projects",), "projects").get(name_or_id.lower())
+             or _index(api, ("projects",), "id", lambda p: p.id).get(name_or_id))
+    if match:
+        return match.id
 
     # Not found - show available projects
     available = sorted([p.name for p in projects])
@@ -197,16 +463,18 @@ def resolve_project_object(api, name_or_id: str):
 
     Returns the SDK Project object. Exits with error if not found.
     """
-    projects = collect_paginated(api.get_projects())
-    name_lower = name_or_id.lower()
+    # A cached name still costs one GET for the object, but not the listing
+    cached = name_cache.lookup(_disk_token(api), "projects", name_or_id)
+    project = _get_by_id(api, ("projects",), api.get_project, cached or name_or_id)
+    if project:
+        return project
 
-    for p in projects:
-        if p.name.lower() == name_lower:
-            return p
+    projects = list_projects(api)
 
-    for p in projects:
-        if p.id == name_or_id:
-            return p
+    match = (_names(api, ("projects",), "projects").get(name_or_id.lower())
+             or _index(api, ("projects",), "id", lambda p: p.id).get(name_or_id))
+    if match:
+        return match
 
     print(f"Error: Project '{name_or_id}' not found", file=sys.stderr)
     sys.exit(1)
@@ -218,18 +486,22 @@ def resolve_section(api, project_id: str, name_or_id: str) -> str:
 
     Returns section ID string. Exits with error if not found.
     """
-    sections = collect_paginated(api.get_sections(project_id=project_id))
-    name_lower = name_or_id.lower()
+    cached = name_cache.lookup(_disk_token(api), f"sections:{project_id}", name_or_id)
+    if cached:
+        return cached
 
-    # Try name lookup
-    for s in sections:
-        if s.name.lower() == name_lower:
-            return s.id
+    section = _get_by_id(api, ("sections", project_id), api.get_section, name_or_id)
+    if section and section.project_id == project_id:
+        return section.id
 
-    # Try ID lookup
-    for s in sections:
-        if s.id == name_or_id:
-            return s.id
+    sections = list_sections(api, project_id)
+
+    # Name first, then ID
+    key = ("sections", project_id)
+    match = (_names(api, key, f"sections:{project_id}").get(name_or_id.lower())
+             or _index(api, key, "id", lambda s: s.id).get(name_or_id))
+    if match:
+        return match.id
 
     # Not found - show available sections
     available = [s.name for s in sections]
@@ -249,14 +521,15 @@ def resolve_assignee(api, project_id: str, name_email_or_id: str) -> str:
     that `accomplis collaborators` emits — the tool's own output must round-trip
     into its own filter (tgt-husule).
     """
-    collaborators = collect_paginated(api.get_collaborators(project_id))
+    collaborators = list_collaborators(api, project_id)
     needle = name_email_or_id.lower()
 
-    for c in collaborators:
-        if (c.name.lower() == needle
-                or c.email.lower() == needle
-                or str(c.id) == name_email_or_id):
-            return c.id
+    key = ("collaborators", project_id)
+    match = (_index(api, key, "name", lambda c: c.name.lower()).get(needle)
+             or _index(api, key, "email", lambda c: c.email.lower()).get(needle)
+             or _index(api, key, "id", lambda c: str(c.id)).get(name_email_or_id))
+    if match:
+        return match.id
 
     partial = [c for c in collaborators if needle in c.name.lower()]
     if len(partial) == 1:
@@ -275,6 +548,15 @@ def resolve_assignee(api, project_id: str, name_email_or_id: str) -> str:
     sys.exit(1)
 
 
+def http_status(e: BaseException) -> int | None:
+    """Status code of a failed API call (httpx.HTTPStatusError), else None."""
+    import httpx
+
+    if isinstance(e, httpx.HTTPStatusError):
+        return e.response.status_code
+    return None
+
+
 def api_call_with_retry(func: Callable, *args, **kwargs) -> Any:
     """
     Execute API call with rate limit handling and retry.
@@ -287,8 +569,7 @@ def api_call_with_retry(func: Callable, *args, **kwargs) -> Any:
             time.sleep(RATE_LIMIT_DELAY)
             return func(*args, **kwargs)
         except Exception as e:
-            error_str = str(e).lower()
-            if "429" in str(e) or "rate limit" in error_str:
+            if http_status(e) == 429:
                 if attempt < MAX_RETRIES - 1:
                     print(f"  ⏳ Rate limited, waiting {RATE_LIMIT_RETRY_DELAY}s...",
                           file=sys.stderr)
@@ -300,9 +581,8 @@ def api_call_with_retry(func: Callable, *args, **kwargs) -> Any:
 
 def handle_task_not_found(e: Exception, task_id: str):
     """Handle task not found errors with clean message."""
-    error_str = str(e).lower()
     # Todoist returns 400 for invalid IDs, 404 for valid-format but missing
-    if "404" in error_str or "not found" in error_str or "400" in error_str:
+    if http_status(e) in (400, 404):
         print(f"Error: Task '{task_id}' not found or invalid", file=sys.stderr)
         sys.exit(1)
     # Re-raise if it's a different error
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Daemon mode: one warm accomplis process serving many CLI calls.
+
+Every invocation otherwise pays interpreter startup, the SDK import, the
+token lookup (a Keychain subprocess on macOS) and a fresh TLS handshake.
+The daemon pays each once: it resolves the token at startup and keeps it.
+Scripts making dozens of calls can start a daemon once and route calls
+through it:
+
+    accomplis daemon &          # serves until interrupted
+    export ACCOMPLIS_DAEMON=1   # accomplis now forwards to it
+    accomplis add "..." && accomplis update ...
+
+With no daemon listening, calls run in-process as usual. The daemon uses
+its own environment and the token it started with (restart it after
+`accomplis auth --token`), serves one request at a time (commands
+write to the process-wide stdout), and returns output in one piece rather
+than streamed.
+"""
+
+import io
+import json
+import os
+import socket
+import sys
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+
+# Commands tied to the caller's own terminal or environment, or to the
+# daemon itself, always run in-process. Only argv is forwarded, so that
+# includes add-batch: it reads the caller's stdin, or a --file relative to
+# the caller's cwd
+LOCAL_COMMANDS = {"add-batch", "auth", "daemon", "doctor", "version"}
+
+
+def socket_path() -> Path:
+    """
+    Per-user socket: in $XDG_RUNTIME_DIR (already private) when set, else in
+    a 0700 directory of our own under the shared temp dir.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "accomplis.sock"
+    return Path(tempfile.gettempdir()) / f"accomplis-{os.getuid()}" / "daemon.sock"
+
+
+def _owned_by_us(path: Path) -> bool:
+    try:
+        return path.lstat().st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def _connect(path: Path):
+    """
+    Connected socket to a listening daemon, or None.
+
+    A socket some other user planted at our path is never used: they would
+    read the forwarded argv (task content) and choose what we print.
+    """
+    if not hasattr(socket, "AF_UNIX") or not _owned_by_us(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _recv_all(conn) -> bytes:
+    chunks = []
+    while chunk := conn.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _exchange(conn, argv: list[str]) -> dict:
+    conn.sendall(json.dumps({"argv": argv}).encode())
+    conn.shutdown(socket.SHUT_WR)
+    return json.loads(_recv_all(conn))
+
+
+def forward(argv: list[str]) -> int | None:
+    """
+    Run argv on a listening daemon, replaying its output here.
+
+    Returns the exit code, or None when no daemon is listening (the caller
+    then runs the command itself).
+    """
+    conn = _connect(socket_path())
+    if conn is None:
+        return None
+    try:
+        with conn:
+            response = _exchange(conn, argv)
+    except (OSError, ValueError):
+        # The daemon took the request but died or dropped it. Don't rerun it
+        # here: it may already have added or moved something
+        print("Error: daemon hung up without replying; the command may or may not "
+              "have run. Check before retrying.", file=sys.stderr)
+        return 1
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return response["code"]
+
+
+def handle(conn):
+    """Run one forwarded command and send back its output and exit code."""
+    from accomplis import cli
+    from accomplis.common import clear_fetch_cache
+
+    request = json.loads(_recv_all(conn))
+    stdout, stderr = io.StringIO(), io.StringIO()
+    code = 0
+    # Each request is its own invocation: lists memoized for the previous
+    # one (projects, sections...) may have changed since
+    clear_fetch_cache()
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            cli.main(request["argv"])
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception as e:
+            print(f"Error: {type(e).__name__}: {e}", file=sys.stderr)
+            code = 1
+    conn.sendall(json.dumps({
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "code": code,
+    }).encode())
+    # Signal end of reply ourselves rather than relying on the caller to close
+    conn.shutdown(socket.SHUT_WR)
+
+
+def serve(path: Path | None = None):
+    """Listen on the socket and serve forwarded commands until interrupted."""
+    if not hasattr(socket, "AF_UNIX"):
+        print("Error: daemon mode needs Unix domain sockets", file=sys.stderr)
+        sys.exit(1)
+    from accomplis.token_store import get_token
+
+    # Requests run through cli.main in this process: never forward to ourselves
+    os.environ.pop("ACCOMPLIS_DAEMON", None)
+    # Resolve the token once: the env var is the first rung get_token() tries,
+    # so requests never reach the Keychain subprocess or the token file
+    os.environ["TODOIST_API_KEY"] = get_token()
+
+    path = path or socket_path()
+    path.parent.mkdir(mode=0o700, exist_ok=True)
+    parent = path.parent.stat()
+    if parent.st_uid != os.getuid() or parent.st_mode & 0o077:
+        print(f"Error: {path.parent} is not a private directory of this user", file=sys.stderr)
+        sys.exit(1)
+    live = _connect(path)
+    if live is not None:
+        live.close()
+        print(f"Error: a daemon is already listening on {path}", file=sys.stderr)
+        sys.exit(1)
+    path.unlink(missing_ok=True)  # stale socket from a daemon that died
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket created 0600: only this user connects
+    try:
+        server.bind(str(path))
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    print(f"accomplis daemon listening on {path} (Ctrl-C to stop)", file=sys.stderr)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    handle(conn)
+                except (OSError, ValueError) as e:
+                    # A client that hung up or sent garbage: drop it, keep serving
+                    print(f"  ✗ request failed: {e}", file=sys.stderr)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
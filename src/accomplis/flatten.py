@@ -31,9 +31,11 @@ from pathlib import Path
 from accomplis.common import (
     get_api,
     collect_paginated,
+    list_projects,
     to_dict,
     resolve_project_object,
     api_call_with_retry,
+    http_status,
     RATE_LIMIT_DELAY,
 )
 
@@ -250,8 +252,7 @@ def cmd_restore(backup_path: str, execute: bool):
             print(f"  ✓ Restored: {content}")
             success_count += 1
         except Exception as e:
-            error_str = str(e).lower()
-            if "404" in str(e) or "not found" in error_str:
+            if http_status(e) == 404:
                 print(f"  ✗ Task not found (deleted?): {content}", file=sys.stderr)
             else:
                 print(f"  ✗ Failed to restore '{content}': {e}", file=sys.stderr)
@@ -303,7 +304,7 @@ def cmd_flatten(args):
     if args.project_id:
         project_id = args.project_id
         # Fetch project name for display
-        projects = collect_paginated(api.get_projects())
+        projects = list_projects(api)
         project_name = next((p.name for p in projects if p.id == project_id), project_id)
     else:
         project = resolve_project_object(api, args.project)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of project and section name -> ID maps.
+
+Scripts run `accomplis update ID --project Foo --section Bar` dozens of
+times in a row, and each call would otherwise list projects and sections
+just to turn names into IDs. The maps are kept in
+$XDG_CACHE_HOME/accomplis/names.json (default ~/.cache) for TTL_SECONDS,
+per account. Commands that create or rename projects and sections drop the
+file, and `accomplis --refresh-cache ...` forces a reload.
+
+Only names and IDs are stored, never task data. A stale entry can at worst
+point at a project renamed in the app within the last TTL_SECONDS.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+TTL_SECONDS = 600
+
+
+def cache_dir() -> Path:
+    """accomplis's directory under $XDG_CACHE_HOME (default ~/.cache)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "accomplis"
+
+
+def cache_file() -> Path:
+    return cache_dir() / "names.json"
+
+
+def _account(token: str) -> str:
+    """Fingerprint of the token, so one account's names never serve another."""
+    import hashlib
+
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+def _fresh(entry) -> bool:
+    return isinstance(entry, dict) and time.time() - entry.get("at", 0) < TTL_SECONDS
+
+
+def _load(token: str) -> dict:
+    """This account's maps, or {} for a missing, corrupt or foreign file."""
+    try:
+        data = json.loads(cache_file().read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("account") != _account(token):
+        return {}
+    maps = data.get("maps")
+    return maps if isinstance(maps, dict) else {}
+
+
+def lookup(token: str | None, key: str, name: str) -> str | None:
+    """Cached ID for a name (case-insensitive) under `key`, or None."""
+    if not token:
+        return None
+    entry = _load(token).get(key)
+    if not _fresh(entry):
+        return None
+    return entry.get("names", {}).get(name.lower())
+
+
+def remember(token: str | None, key: str, names: dict[str, str]):
+    """Save a lowercased-name -> ID map under `key`, dropping expired ones."""
+    if not token:
+        return
+    import tempfile
+
+    maps = {k: v for k, v in _load(token).items() if _fresh(v)}
+    maps[key] = {"at": time.time(), "names": names}
+    path = cache_file()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename: a concurrent reader sees the old file or the
+        # new one, never half of either
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".names-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"account": _account(token), "maps": maps}, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass  # unwritable cache dir: every call just resolves over the network
+
+
+def forget():
+    """Drop every cached name, e.g. after a project or section is created or renamed."""
+    try:
+        cache_file().unlink(missing_ok=True)
+    except OSError:
+        pass
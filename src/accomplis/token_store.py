@@ -19,9 +19,9 @@ Usage:
 """
 
 import os
-import shutil
-import subprocess
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -47,11 +47,30 @@ TOKEN_FILE = (
 )
 
 
+# A token read from the Keychain or file is reused for this long: one
+# invocation asks for it more than once (SDK client, /user call), and each
+# Keychain read is a `security` process
+TOKEN_MEMO_SECONDS = 60
+_memo: Optional[tuple[str, float]] = None  # (token, time.monotonic() when read)
+
+# store_token's result when the backend already held the token
+UNCHANGED = "unchanged"
+
+
+@lru_cache(maxsize=1)
 def _has_keychain() -> bool:
-    """Check if macOS Keychain is available."""
+    """Check if macOS Keychain is available (a $PATH scan, so done once)."""
+    import shutil
+
     return shutil.which("security") is not None
 
 
+@lru_cache(maxsize=1)
+def _user() -> str:
+    """Keychain account name: the login user."""
+    return os.environ.get("USER", "")
+
+
 def _get_from_env() -> Optional[str]:
     """Get token from environment variable."""
     return os.environ.get("TODOIST_API_KEY")
@@ -61,9 +80,11 @@ def _get_from_keychain() -> Optional[str]:
     """Get token from macOS Keychain."""
     if not _has_keychain():
         return None
+    import subprocess
+
     try:
         result = subprocess.run(
-            ["security", "find-generic-password", "-a", os.environ.get("USER", ""), "-s", KEYCHAIN_SERVICE, "-w"],
+            ["security", "find-generic-password", "-a", _user(), "-s", KEYCHAIN_SERVICE, "-w"],
             capture_output=True, text=True, check=True
         )
         return result.stdout.strip()
@@ -84,21 +105,25 @@ def _get_from_keychain() -> Optional[str]:
 
 def _get_from_file() -> Optional[str]:
     """Get token from file, migrating from older locations if needed."""
-    if TOKEN_FILE.exists():
+    # Open and catch rather than exists()-then-read: one syscall fewer, and
+    # no gap between the check and the read
+    try:
         return TOKEN_FILE.read_text().strip()
+    except FileNotFoundError:
+        pass
     if TOKEN_FILE == _LEGACY_TOKEN_FILE:
         return None
     # Migrate on first read: older plugin-data dirs newest-first, then the
     # legacy home file. Originals are left in place (cheap, and another
     # machine's older install may still read them).
     for old in (*(d / "token" for d in _OLD_PLUGIN_DATA_DIRS), _LEGACY_TOKEN_FILE):
-        if old.exists():
+        try:
             token = old.read_text().strip()
-            if token:
-                TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-                TOKEN_FILE.write_text(token + "\n")
-                TOKEN_FILE.chmod(0o600)
-                return token
+        except FileNotFoundError:
+            continue
+        if token:
+            _write_token_file(token)
+            return token
     return None
 
 
@@ -106,19 +131,17 @@ def _store_to_keychain(token: str) -> bool:
     """Store token in macOS Keychain."""
     if not _has_keychain():
         return False
-    user = os.environ.get("USER", "")
+    import subprocess
+
+    user = _user()
     try:
-        # Delete existing entry (ignore errors)
-        subprocess.run(
-            ["security", "delete-generic-password", "-a", user, "-s", KEYCHAIN_SERVICE],
-            capture_output=True, check=False
-        )
-        # Add new entry
+        # -U updates the item if it exists, else adds it: one process, and
+        # no window in which the old token is gone but the new one not yet in.
         # Note: Token appears in process list briefly. macOS security command doesn't
         # support stdin for -w flag. Acceptable for local CLI (same-user visibility only).
         # For stricter environments, consider using Python's keyring library.
         subprocess.run(
-            ["security", "add-generic-password", "-a", user, "-s", KEYCHAIN_SERVICE, "-w", token],
+            ["security", "add-generic-password", "-U", "-a", user, "-s", KEYCHAIN_SERVICE, "-w", token],
             check=True, capture_output=True
         )
         return True
@@ -136,17 +159,43 @@ def _store_to_keychain(token: str) -> bool:
         return False
 
 
+def _write_token_file(token: str):
+    """Write TOKEN_FILE atomically, never readable by anyone but the owner."""
+    import tempfile
+
+    TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
+    # mkstemp creates the file 0600, and the rename swaps it in whole: no
+    # moment where the token sits in a world-readable or half-written file
+    fd, tmp = tempfile.mkstemp(dir=TOKEN_FILE.parent, prefix=".token-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(token + "\n")
+        os.replace(tmp, TOKEN_FILE)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
 def _store_to_file(token: str) -> bool:
     """Store token in file with restricted permissions."""
     try:
-        TOKEN_FILE.parent.mkdir(parents=True, exist_ok=True)
-        TOKEN_FILE.write_text(token + "\n")
-        TOKEN_FILE.chmod(0o600)
+        _write_token_file(token)
         return True
     except OSError:
         return False
 
 
+def _get_persisted() -> Optional[str]:
+    """Token from Keychain, else file; memoized for TOKEN_MEMO_SECONDS."""
+    global _memo
+    if _memo is not None and time.monotonic() - _memo[1] < TOKEN_MEMO_SECONDS:
+        return _memo[0]
+    token = _get_from_keychain() or _get_from_file()
+    if token:
+        _memo = (token, time.monotonic())
+    return token
+
+
 def get_token() -> str:
     """
     Get Todoist API token from available backends.
@@ -159,13 +208,9 @@ def get_token() -> str:
     if token:
         return token
 
-    # 2. macOS Keychain
-    token = _get_from_keychain()
-    if token:
-        return token
-
-    # 3. File fallback
-    token = _get_from_file()
+    # 2. macOS Keychain, 3. file fallback (the env var is never memoized:
+    # reading it is free, and it may change under a long-lived process)
+    token = _get_persisted()
     if token:
         return token
 
@@ -181,7 +226,7 @@ def get_token() -> str:
         "$TODOIST_API_KEY environment variable — "
         + ("set but empty" if env_val is not None else "unset")
     ]
-    user = os.environ.get("USER", "")
+    user = _user()
     if _has_keychain():
         checked.append(
             f"macOS Keychain service '{KEYCHAIN_SERVICE}' (account '{user}') — no entry"
@@ -207,16 +252,28 @@ def get_token() -> str:
 
 def get_token_quiet() -> Optional[str]:
     """Get token without exiting on failure. Returns None if not found."""
-    return _get_from_env() or _get_from_keychain() or _get_from_file()
+    return _get_from_env() or _get_persisted()
 
 
-def store_token(token: str) -> bool:
+def store_token(token: str, force: bool = False) -> bool | str:
     """
     Store token using best available backend.
 
     On macOS: uses Keychain
     On Linux: uses file with 600 permissions
+
+    A token the backend already holds is left alone unless force is set:
+    re-storing it would rewrite the Keychain item (a `security` process) or
+    the file, for nothing. Returns True if stored, UNCHANGED (also truthy)
+    if left alone, False on failure.
     """
+    global _memo
+    _memo = None  # whatever happens below, the next read goes to the backend
+    if not force:
+        stored = _get_from_keychain() if _has_keychain() else _get_from_file()
+        if stored == token:
+            return UNCHANGED
+
     if _has_keychain():
         if _store_to_keychain(token):
             print("  Token stored in macOS Keychain.", file=sys.stderr)
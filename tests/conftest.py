@@ -0,0 +1,9 @@
+"""Fixtures shared by every test module."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_name_cache(tmp_path, monkeypatch):
+    """Point the on-disk name cache at a per-test directory, never ~/.cache."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
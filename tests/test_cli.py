@@ -2,10 +2,12 @@
 
 import json
 import sys
+from datetime import datetime, timezone
 from io import StringIO
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 
@@ -83,7 +85,8 @@ class TestGetCurrentUser:
             )
 
         stub = httpx.Client(transport=httpx.MockTransport(handler))
-        with patch.object(common, "_build_client", return_value=stub):
+        with patch.object(common, "_SESSION", None), \
+                patch.object(common, "_build_client", return_value=stub):
             user = common.get_current_user()
 
         assert user["id"] == "123"
@@ -94,19 +97,90 @@ class TestGetCurrentUser:
         assert requests[0].headers["Authorization"] == "Bearer test-token"
 
     @patch("accomplis.token_store.get_token", return_value="bad-token")
-    @patch("httpx.get")
-    def test_raises_on_401(self, mock_get, mock_token):
-        from accomplis.common import get_current_user
+    def test_raises_on_401(self, mock_token):
         import httpx
 
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "401 Unauthorized", request=MagicMock(), response=MagicMock(status_code=401)
+        from accomplis import common
+
+        stub = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(401))
         )
-        mock_get.return_value = mock_response
+        with patch.object(common, "_SESSION", stub):
+            with pytest.raises(httpx.HTTPStatusError):
+                common.get_current_user()
 
-        with pytest.raises(httpx.HTTPStatusError):
-            get_current_user()
+
+class TestAuthStatus:
+    @patch("accomplis.auth.get_token_quiet", return_value="stored-token")
+    def test_probe_is_one_small_request(self, mock_token):
+        from accomplis import common
+        from accomplis.auth import get_auth_status
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"results": [], "next_cursor": None})
+
+        stub = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch.object(common, "_SESSION", stub):
+            assert get_auth_status()["authenticated"] is True
+        assert len(requests) == 1
+        assert requests[0].url.params["limit"] == "1"
+        assert requests[0].headers["Authorization"] == "Bearer stored-token"
+        assert requests[0].extensions["timeout"]["connect"] == common.PROBE_CONNECT_TIMEOUT
+
+    @patch("accomplis.auth.get_token_quiet", return_value="stored-token")
+    def test_definite_status_cached_briefly(self, mock_token):
+        from accomplis import common
+        from accomplis.auth import get_auth_status
+
+        with patch.object(common, "verify_token", side_effect=status_error(401)) as probe:
+            assert get_auth_status()["authenticated"] is False
+            assert get_auth_status()["authenticated"] is False
+            assert probe.call_count == 1
+            get_auth_status(use_cache=False)  # doctor: always live
+            assert probe.call_count == 2
+
+    @patch("accomplis.auth.get_token_quiet")
+    def test_new_token_or_network_error_not_served_from_cache(self, mock_token):
+        from accomplis import common
+        from accomplis.auth import get_auth_status
+
+        with patch.object(common, "verify_token") as probe:
+            mock_token.return_value = "old-token"
+            get_auth_status()
+            mock_token.return_value = "new-token"
+            probe.side_effect = httpx.ConnectError("offline")
+            assert "could not verify" in get_auth_status()["message"]
+            probe.side_effect = None
+            get_auth_status()
+        assert probe.call_count == 3
+
+
+class TestDoctor:
+    @patch("accomplis.auth.get_auth_status",
+           return_value={"authenticated": False, "message": "Not authenticated."})
+    def test_broken_dependency_reported_with_reason(self, mock_status, capsys):
+        """An SDK that is installed but fails to import is a failure, not a ✓."""
+        import builtins
+
+        from accomplis.cli import cmd_doctor
+
+        real_import = builtins.__import__
+
+        def broken_sdk(name, *args, **kwargs):
+            if name == "todoist_api_python":
+                raise ImportError("No module named 'dataclass_wizard'", name="dataclass_wizard")
+            return real_import(name, *args, **kwargs)
+
+        with patch.object(builtins, "__import__", broken_sdk), pytest.raises(SystemExit):
+            cmd_doctor(SimpleNamespace())
+
+        out = capsys.readouterr().out
+        assert "✗ todoist_api_python" in out
+        assert "fails to import: No module named 'dataclass_wizard'" in out
+        assert "✓ httpx" in out
 
 
 # --- cmd_whoami ---
@@ -230,9 +304,9 @@ class TestAutoFilter:
             make_collaborator("200", "Them"),
         ]
 
+        mock_api.return_value.get_tasks.return_value = paginated(my_task, their_task, unassigned)
+        mock_api.return_value.get_collaborators.return_value = paginated(*collabs)
         mock_collect.side_effect = [
-            [my_task, their_task, unassigned],  # get_tasks
-            collabs,                             # get_collaborators
             [],                                  # comments for t1
         ]
 
@@ -266,9 +340,9 @@ class TestAutoFilter:
         unassigned = make_task("t3", "Unassigned task", assignee_id=None)
         collabs = [make_collaborator("100", "Me")]
 
+        mock_api.return_value.get_tasks.return_value = paginated(my_task, unassigned)
+        mock_api.return_value.get_collaborators.return_value = paginated(*collabs)
         mock_collect.side_effect = [
-            [my_task, unassigned],  # get_tasks
-            collabs,                # get_collaborators
             [],                     # comments for t3
         ]
 
@@ -301,9 +375,9 @@ class TestAutoFilter:
             make_collaborator("200", "Them"),
         ]
 
+        mock_api.return_value.get_tasks.return_value = paginated(my_task, their_task)
+        mock_api.return_value.get_collaborators.return_value = paginated(*collabs)
         mock_collect.side_effect = [
-            [my_task, their_task],  # get_tasks
-            collabs,                # get_collaborators
             [],                     # comments for t1
             [],                     # comments for t2
         ]
@@ -330,9 +404,9 @@ class TestAutoFilter:
 
         tasks = [make_task("t1", "Task A"), make_task("t2", "Task B")]
 
+        mock_api.return_value.get_tasks.return_value = paginated(*tasks)
+        mock_api.return_value.get_collaborators.return_value = paginated()
         mock_collect.side_effect = [
-            tasks,  # get_tasks
-            [],     # get_collaborators (empty)
             [],     # comments for t1
             [],     # comments for t2
         ]
@@ -365,9 +439,9 @@ class TestAutoFilter:
             make_collaborator("200", "Them"),
         ]
 
+        mock_api.return_value.get_tasks.return_value = paginated(my_task, their_task, unassigned)
+        mock_api.return_value.get_collaborators.return_value = paginated(*collabs)
         mock_collect.side_effect = [
-            [my_task, their_task, unassigned],  # get_tasks
-            collabs,                             # get_collaborators
             [],                                  # comments for t1
             [],                                  # comments for t2
             [],                                  # comments for t3
@@ -415,6 +489,372 @@ class TestCommentGuardRemoval:
         assert out["comments"][0]["attachment"]["file_name"] == "report.pdf"
 
 
+class TestNoComments:
+    @patch("accomplis.cli.get_api")
+    def test_tasks_skip_comment_fetches(self, mock_api, capsys):
+        from accomplis.cli import cmd_get_tasks
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_tasks.return_value = paginated(make_task("t1", "A"), make_task("t2", "B"))
+
+        cmd_get_tasks(date_filter_args(project=None, older_than=None, no_comments=True))
+
+        out = json.loads(capsys.readouterr().out)
+        assert [t["id"] for t in out] == ["t1", "t2"]
+        assert all("comments" not in t for t in out)
+        api.get_comments.assert_not_called()
+
+    @patch("accomplis.cli.get_api")
+    def test_single_task_skips_comment_fetch(self, mock_api, capsys):
+        from accomplis.cli import cmd_get_task
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_task.return_value = make_task("t1", "A")
+
+        cmd_get_task(SimpleNamespace(id="t1", no_comments=True))
+
+        assert "comments" not in json.loads(capsys.readouterr().out)
+        api.get_comments.assert_not_called()
+
+
+class TestConcurrentComments:
+    @patch("accomplis.cli.get_api")
+    @patch("accomplis.cli.resolve_project_object")
+    def test_comments_stay_with_their_task(self, mock_resolve, mock_api, capsys):
+        """Fetches run concurrently; the slowest finishing first must not shuffle them."""
+        import time
+
+        from accomplis.cli import cmd_get_tasks
+
+        mock_resolve.return_value = make_project("p1", "Personal")
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_tasks.return_value = paginated(
+            make_task("t1", "A"), make_task("t2", "B"), make_task("t3", "C")
+        )
+        api.get_collaborators.return_value = paginated()
+
+        def comments(task_id):
+            time.sleep({"t1": 0.05, "t2": 0.0, "t3": 0.02}[task_id])
+            return paginated(make_comment(f"note on {task_id}"))
+
+        api.get_comments.side_effect = comments
+
+        args = SimpleNamespace(
+            project="Personal", project_id=None, section=None, section_id=None,
+            label=None, assignee=None, team=False, unassigned=False,
+            created_before=None, older_than=None, include_section_name=False,
+        )
+        cmd_get_tasks(args)
+
+        out = json.loads(capsys.readouterr().out)
+        assert [t["id"] for t in out] == ["t1", "t2", "t3"]
+        assert [t["comments"][0]["content"] for t in out] == [
+            "note on t1", "note on t2", "note on t3"
+        ]
+
+    @patch("accomplis.cli.get_api")
+    def test_failed_fetch_flags_task(self, mock_api, capsys):
+        from accomplis.cli import cmd_get_tasks
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_tasks.return_value = paginated(make_task("t1", "A"), make_task("t2", "B"))
+
+        def comments(task_id):
+            if task_id == "t1":
+                raise status_error(500)
+            return paginated(make_comment("ok"))
+
+        api.get_comments.side_effect = comments
+
+        args = SimpleNamespace(
+            project=None, project_id=None, section=None, section_id=None,
+            label=None, assignee=None, team=False, unassigned=False,
+            created_before=None, older_than=None, include_section_name=False,
+        )
+        cmd_get_tasks(args)
+
+        captured = capsys.readouterr()
+        out = json.loads(captured.out)
+        assert out[0]["comments"] == []
+        assert out[0]["comments_error"] is True
+        assert out[1]["comments"] == [{"content": "ok", "attachment": None}]
+        assert "comments_error" not in out[1]
+        assert "task t1" in captured.err
+
+    @patch("accomplis.cli.get_api")
+    def test_unauthorized_still_aborts(self, mock_api, capsys):
+        from accomplis.cli import cmd_get_tasks
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_tasks.return_value = paginated(make_task("t1", "A"))
+        api.get_comments.side_effect = status_error(401)
+
+        args = SimpleNamespace(
+            project=None, project_id=None, section=None, section_id=None,
+            label=None, assignee=None, team=False, unassigned=False,
+            created_before=None, older_than=None, include_section_name=False,
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            cmd_get_tasks(args)
+
+
+class TestConcurrentPrefetch:
+    @patch("accomplis.cli.get_current_user")
+    @patch("accomplis.cli.get_api")
+    def test_collaborators_sections_and_user_overlap(self, mock_api, mock_user, capsys):
+        """Each fetch waits on a barrier the others must reach: serial calls would time out."""
+        import threading
+
+        from accomplis.cli import cmd_get_tasks
+
+        barrier = threading.Barrier(3, timeout=2)
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_project.return_value = make_project("p1", "Team", workspace_id="ws1")
+
+        def collaborators(project_id):
+            barrier.wait()
+            return paginated(make_collaborator("u1", "Alice"))
+
+        def sections(project_id):
+            barrier.wait()
+            return paginated(SimpleNamespace(id="s1", name="Now"))
+
+        def user():
+            barrier.wait()
+            return {"id": "u1", "full_name": "Alice"}
+
+        api.get_collaborators.side_effect = collaborators
+        api.get_sections.side_effect = sections
+        mock_user.side_effect = user
+        api.get_tasks.return_value = paginated(
+            make_task("t1", "Mine", assignee_id="u1", section_id="s1"),
+            make_task("t2", "Theirs", assignee_id="u2"),
+        )
+        api.get_comments.side_effect = lambda task_id: paginated()
+
+        args = SimpleNamespace(
+            project=None, project_id="p1", section=None, section_id=None,
+            label=None, assignee=None, team=False, unassigned=False,
+            created_before=None, older_than=None, include_section_name=True,
+        )
+        cmd_get_tasks(args)
+
+        out = json.loads(capsys.readouterr().out)
+        assert [(t["id"], t["section_name"]) for t in out] == [("t1", "Now")]
+
+
+def date_filter_args(**overrides):
+    args = dict(
+        project="Work", project_id=None, section=None, section_id=None,
+        label=None, assignee=None, team=False, unassigned=False,
+        created_before=None, older_than="30d", include_section_name=False,
+    )
+    args.update(overrides)
+    return SimpleNamespace(**args)
+
+
+class TestFilterPushDown:
+    @patch("accomplis.cli.get_api")
+    def test_date_filter_runs_server_side(self, mock_api, capsys):
+        from accomplis.cli import cmd_get_tasks
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_projects.return_value = paginated(make_project("p1", "Work"))
+        api.get_collaborators.return_value = paginated()
+        api.get_comments.side_effect = lambda task_id: paginated()
+        api.filter_tasks.return_value = paginated(
+            make_task("t1", "Old", created_at="2020-01-01T00:00:00Z"),
+            make_task("t2", "Same name, other project", project_id="p2",
+                      created_at="2020-01-01T00:00:00Z"),
+            make_task("t3", "Inside the slack", created_at=datetime.now().isoformat()),
+        )
+
+        cmd_get_tasks(date_filter_args())
+
+        api.filter_tasks.assert_called_once_with(query="#Work & created before: -28 days")
+        api.get_tasks.assert_not_called()
+        assert [t["id"] for t in json.loads(capsys.readouterr().out)] == ["t1"]
+
+    @patch("accomplis.cli.get_api")
+    def test_rejected_query_falls_back_to_get_tasks(self, mock_api, capsys):
+        from accomplis.cli import cmd_get_tasks
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_projects.return_value = paginated(make_project("p1", "Work"))
+        api.get_collaborators.return_value = paginated()
+        api.get_comments.side_effect = lambda task_id: paginated()
+        api.filter_tasks.side_effect = status_error(400)
+        api.get_tasks.return_value = paginated(make_task("t1", "Old"))
+
+        cmd_get_tasks(date_filter_args())
+
+        api.get_tasks.assert_called_once_with(project_id="p1", section_id=None, label=None)
+        assert [t["id"] for t in json.loads(capsys.readouterr().out)] == ["t1"]
+
+    @patch("accomplis.cli.get_current_user")
+    @patch("accomplis.cli.get_api")
+    def test_workspace_notice_keeps_project_totals(self, mock_api, mock_user, capsys):
+        """The "N of M" notice counts the whole project, so no date push-down."""
+        from accomplis.cli import cmd_get_tasks
+
+        api = MagicMock()
+        mock_api.return_value = api
+        mock_user.return_value = {"id": "100", "full_name": "Me"}
+        api.get_projects.return_value = paginated(make_project("p1", "Work", workspace_id="ws1"))
+        api.get_collaborators.return_value = paginated(
+            make_collaborator("100", "Me"), make_collaborator("200", "Them"))
+        api.get_comments.side_effect = lambda task_id: paginated()
+        api.get_tasks.return_value = paginated(
+            make_task("t1", "Mine, old", assignee_id="100", created_at="2020-01-01T00:00:00Z"),
+            make_task("t2", "Mine, new", assignee_id="100", created_at=datetime.now().isoformat()),
+            make_task("t3", "Theirs, old", assignee_id="200", created_at="2020-01-01T00:00:00Z"),
+        )
+
+        cmd_get_tasks(date_filter_args())
+
+        api.filter_tasks.assert_not_called()
+        captured = capsys.readouterr()
+        assert [t["id"] for t in json.loads(captured.out)] == ["t1"]
+        assert "Showing 2 of 3 tasks (assigned to Me)" in captured.err
+
+    def test_query_skips_names_needing_escapes(self):
+        from datetime import timedelta
+
+        from accomplis.cli import _filter_query
+
+        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=10)
+        assert _filter_query(cutoff, project_name="@Wait") is None
+        assert _filter_query(cutoff, project_name="Work", section_name="A & B", label="urgent") == \
+            "#Work & @urgent & created before: -8 days"
+        assert _filter_query(datetime.now(), project_name="Work") is None  # too recent to help
+
+
+class TestLimitOffset:
+    @patch("accomplis.cli.get_api")
+    def test_slice_applies_before_comments_and_stops_paging(self, mock_api, capsys):
+        from accomplis.cli import cmd_get_tasks
+
+        api = MagicMock()
+        mock_api.return_value = api
+
+        def pages(**kwargs):
+            yield [make_task("t1", "A"), make_task("t2", "B")]
+            yield [make_task("t3", "C")]
+            raise AssertionError("page 3 requested after the limit was reached")
+
+        api.get_tasks.side_effect = pages
+        api.get_comments.side_effect = lambda task_id: paginated()
+
+        cmd_get_tasks(date_filter_args(project=None, older_than=None, limit=2, offset=1))
+
+        assert [t["id"] for t in json.loads(capsys.readouterr().out)] == ["t2", "t3"]
+        assert sorted(c.kwargs["task_id"] for c in api.get_comments.call_args_list) == ["t2", "t3"]
+
+    def test_negative_limit_rejected(self, monkeypatch, capsys):
+        from accomplis import cli
+
+        monkeypatch.setattr(sys, "argv", ["accomplis", "projects", "--limit", "-1"])
+        with pytest.raises(SystemExit):
+            cli.main()
+        assert "must be 0 or more" in capsys.readouterr().err
+
+
+class TestAddTask:
+    @patch("accomplis.cli.get_api")
+    def test_add_through_main(self, mock_api, capsys):
+        from accomplis import cli
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_projects.return_value = paginated(make_project("p1", "Work"))
+        api.add_task.return_value = make_task("t1", "Buy milk", project_id="p1")
+
+        cli.main(["add", "Buy milk", "--project", "Work", "--labels", "home,errand"])
+
+        kwargs = api.add_task.call_args.kwargs
+        assert kwargs["content"] == "Buy milk"
+        assert kwargs["project_id"] == "p1"
+        assert kwargs["labels"] == ["home", "errand"]
+        assert json.loads(capsys.readouterr().out)["id"] == "t1"
+
+
+class TestAddBatch:
+    @patch("accomplis.cli.get_api")
+    def test_tree_created_level_by_level(self, mock_api, monkeypatch, capsys):
+        from accomplis.cli import cmd_add_batch
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_projects.return_value = paginated(make_project("p1", "Work"))
+        counter = iter(range(1, 100))
+        api.add_task.side_effect = lambda content, **kw: make_task(f"t{next(counter)}", content)
+        tree = {"content": "Launch", "children": [
+            {"content": "Draft", "children": [{"content": "Outline"}]},
+            {"content": "Review"},
+        ]}
+        monkeypatch.setattr(sys, "stdin", StringIO(json.dumps(tree)))
+
+        cmd_add_batch(SimpleNamespace(file=None, project="Work", project_id=None,
+                                      section=None, section_id=None))
+
+        calls = {c.args[0] if c.args else c.kwargs["content"]: c.kwargs
+                 for c in api.add_task.call_args_list}
+        assert calls["Launch"]["project_id"] == "p1"
+        assert (calls["Draft"]["parent_id"], calls["Draft"]["order"]) == ("t1", 1)
+        assert (calls["Review"]["parent_id"], calls["Review"]["order"]) == ("t1", 2)
+        out = json.loads(capsys.readouterr().out)
+        assert out["id"] == "t1"
+        assert [c["content"] for c in out["children"]] == ["Draft", "Review"]
+        draft = out["children"][0]
+        assert calls["Outline"]["parent_id"] == draft["id"]
+        assert draft["children"][0]["content"] == "Outline"
+
+    @patch("accomplis.cli.get_api")
+    def test_malformed_tree_creates_nothing(self, mock_api, monkeypatch, capsys):
+        from accomplis.cli import cmd_add_batch
+
+        api = MagicMock()
+        mock_api.return_value = api
+        tree = [{"content": "Ok", "children": [{"content": "Typo", "labelz": ["x"]}]}]
+        monkeypatch.setattr(sys, "stdin", StringIO(json.dumps(tree)))
+
+        with pytest.raises(SystemExit):
+            cmd_add_batch(SimpleNamespace(file=None, project=None, project_id=None,
+                                          section=None, section_id=None))
+        assert "input[0].children[0] has unknown keys: labelz" in capsys.readouterr().err
+        api.add_task.assert_not_called()
+
+
+    @pytest.mark.parametrize("node, message", [
+        ({"content": "a", "priority": "urgent"}, "\"priority\" must be a whole number from 1 to 4"),
+        ({"content": "a", "priority": 5}, "\"priority\" must be a whole number from 1 to 4"),
+        ({"content": "a", "labels": "x,y"}, "\"labels\" must be a list of strings"),
+        ({"content": "a", "children": [{"content": "b", "due": 5}]},
+         "input[0].children[0] \"due\" must be a string"),
+        ({"content": "a", "description": ["x"]}, "\"description\" must be a string"),
+    ])
+    @patch("accomplis.cli.get_api")
+    def test_bad_field_types_create_nothing(self, mock_api, node, message, monkeypatch, capsys):
+        from accomplis.cli import cmd_add_batch
+
+        api = MagicMock()
+        mock_api.return_value = api
+        monkeypatch.setattr(sys, "stdin", StringIO(json.dumps([node])))
+
+        with pytest.raises(SystemExit):
+            cmd_add_batch(SimpleNamespace(file=None, project=None, project_id=None,
+                                          section=None, section_id=None))
+        assert message in capsys.readouterr().err
+        api.add_task.assert_not_called()
+
 # --- update: --no-section, --order; reorder ---
 
 
@@ -462,12 +902,48 @@ class TestOrder:
         task = make_task("t1", "Queue item", project_id="p1")
         api = MagicMock()
         mock_api.return_value = api
-        api.get_task.return_value = task
+        api.update_task.return_value = task
 
         cmd_update_task(make_update_args(order=3))
 
         api.update_task.assert_called_once_with("t1", order=3)
         api.move_task.assert_not_called()
+        api.get_task.assert_not_called()  # update's response is the output
+        assert json.loads(capsys.readouterr().out)["id"] == "t1"
+
+
+class TestUpdatePrefetch:
+    @patch("accomplis.cli.get_api")
+    def test_task_fetched_once_for_section_and_assignee(self, mock_api, capsys):
+        from accomplis.cli import cmd_update_task
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_task.return_value = make_task("t1", "Item", project_id="p1")
+        api.get_sections.return_value = paginated(SimpleNamespace(id="s1", name="Now"))
+        api.get_collaborators.return_value = paginated(make_collaborator("100", "Alice"))
+        api.update_task.return_value = make_task("t1", "Item", project_id="p1")
+
+        cmd_update_task(make_update_args(section="Now", assignee="Alice"))
+
+        api.get_task.assert_called_once_with("t1")
+        api.move_task.assert_called_once_with("t1", section_id="s1")
+        api.update_task.assert_called_once_with("t1", assignee_id="100")
+
+    @patch("accomplis.cli.get_api")
+    def test_project_move_needs_no_task_fetch(self, mock_api, capsys):
+        from accomplis.cli import cmd_update_task
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_projects.return_value = paginated(make_project("p2", "Someday"))
+        api.get_sections.return_value = paginated(SimpleNamespace(id="s9", name="Later"))
+        api.update_task.return_value = make_task("t1", "Item", project_id="p2")
+
+        cmd_update_task(make_update_args(project="Someday", section="Later", due="tomorrow"))
+
+        api.get_task.assert_not_called()
+        api.move_task.assert_called_once_with("t1", project_id="p2", section_id="s9")
 
 
 class TestReorder:
@@ -583,3 +1059,658 @@ class TestDoneNote:
 
         api.update_task.assert_not_called()
         api.get_task.assert_not_called()
+
+
+class TestFetchCache:
+    """Lists fetched to resolve a name are reused, not re-paginated, in one invocation."""
+
+    @patch("accomplis.cli.get_api")
+    def test_section_filter_and_section_names_share_one_fetch(self, mock_api, capsys):
+        from accomplis.cli import cmd_get_tasks
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_projects.return_value = paginated(make_project("p1", "Work"))
+        api.get_sections.return_value = paginated(
+            SimpleNamespace(id="s1", name="Now"), SimpleNamespace(id="s2", name="Later")
+        )
+        api.get_tasks.return_value = paginated(make_task("t1", "A", section_id="s1"))
+        api.get_collaborators.return_value = paginated()
+        api.get_comments.side_effect = lambda task_id: paginated()
+
+        args = SimpleNamespace(
+            project="Work", project_id=None, section="Now", section_id=None,
+            label=None, assignee=None, team=False, unassigned=False,
+            created_before=None, older_than=None, include_section_name=True,
+        )
+        cmd_get_tasks(args)
+
+        out = json.loads(capsys.readouterr().out)
+        assert out[0]["section_name"] == "Now"
+        assert api.get_sections.call_count == 1
+        api.get_tasks.assert_called_once_with(project_id="p1", section_id="s1", label=None)
+
+    @patch("accomplis.cli.get_api")
+    def test_numeric_section_with_section_names_skips_single_get(self, mock_api, capsys):
+        from accomplis.cli import cmd_get_tasks
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_project.return_value = make_project("p1", "Work")
+        api.get_sections.return_value = paginated(SimpleNamespace(id="123", name="Now"))
+        api.get_tasks.return_value = paginated(make_task("t1", "A", section_id="123"))
+        api.get_collaborators.return_value = paginated()
+        api.get_comments.side_effect = lambda task_id: paginated()
+
+        args = SimpleNamespace(
+            project=None, project_id="p1", section="123", section_id=None,
+            label=None, assignee=None, team=False, unassigned=False,
+            created_before=None, older_than=None, include_section_name=True,
+        )
+        cmd_get_tasks(args)
+
+        assert json.loads(capsys.readouterr().out)[0]["section_name"] == "Now"
+        assert api.get_sections.call_count == 1
+        api.get_section.assert_not_called()
+
+    @patch("accomplis.cli.get_api")
+    def test_assignee_filter_reuses_enrichment_collaborators(self, mock_api, capsys):
+        from accomplis.cli import cmd_get_tasks
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_project.return_value = make_project("p1", "Shared")
+        api.get_collaborators.return_value = paginated(
+            make_collaborator("100", "Alice"), make_collaborator("200", "Bob")
+        )
+        api.get_tasks.return_value = paginated(
+            make_task("t1", "A", assignee_id="100"), make_task("t2", "B", assignee_id="200")
+        )
+        api.get_comments.side_effect = lambda task_id: paginated()
+
+        args = SimpleNamespace(
+            project=None, project_id="p1", section=None, section_id=None,
+            label=None, assignee="Bob", team=False, unassigned=False,
+            created_before=None, older_than=None, include_section_name=False,
+        )
+        cmd_get_tasks(args)
+
+        out = json.loads(capsys.readouterr().out)
+        assert [(t["id"], t["assignee_name"]) for t in out] == [("t2", "Bob")]
+        assert api.get_collaborators.call_count == 1
+
+    def test_name_index_built_once(self):
+        from accomplis import common
+
+        api = MagicMock()
+        api.get_projects.return_value = paginated(make_project("p1", "Work"), make_project("p2", "Home"))
+
+        with patch.object(common, "_index_by", wraps=common._index_by) as spy:
+            assert common.resolve_project(api, "work") == "p1"
+            assert common.resolve_project(api, "Home") == "p2"
+            assert common.resolve_project_object(api, "HOME").id == "p2"
+        assert spy.call_count == 1
+
+    def test_cache_is_per_api_instance(self):
+        from accomplis.common import list_projects
+
+        first, second = MagicMock(), MagicMock()
+        first.get_projects.return_value = paginated(make_project("p1", "A"))
+        second.get_projects.return_value = paginated(make_project("p2", "B"))
+
+        assert [p.id for p in list_projects(first)] == ["p1"]
+        assert [p.id for p in list_projects(first)] == ["p1"]
+        assert [p.id for p in list_projects(second)] == ["p2"]
+        assert first.get_projects.call_count == 1
+
+
+class TestResolveProject:
+    def _api(self):
+        api = MagicMock()
+        api.get_projects.return_value = paginated(
+            make_project("p1", "Work"),
+            make_project("p2", "work"),
+            make_project("p3", "Home"),
+        )
+        return api
+
+    def test_name_is_case_insensitive_and_first_match_wins(self):
+        from accomplis.common import resolve_project
+        assert resolve_project(self._api(), "WORK") == "p1"
+
+    def test_id_resolves_when_no_name_matches(self):
+        from accomplis.common import resolve_project
+        assert resolve_project(self._api(), "p3") == "p3"
+
+    def test_unknown_exits_listing_available(self, capsys):
+        from accomplis.common import resolve_project
+        with pytest.raises(SystemExit):
+            resolve_project(self._api(), "Garden")
+        assert "Home" in capsys.readouterr().err
+
+
+class TestOutputJsonStream:
+    """Streaming must be byte-for-byte the one-shot json.dumps of the same list."""
+
+    @pytest.fixture(params=["orjson", "stdlib"], autouse=True)
+    def serializer(self, request, monkeypatch):
+        from accomplis import cli
+
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(cli, "orjson", None)
+
+    @pytest.mark.parametrize("items", [
+        [],
+        [{"id": "1"}],
+        [{"id": "1", "labels": ["a", "b"], "due": None}, {"id": "2", "content": "x\ny"}],
+        [{"id": "1", "created_at": datetime(2026, 1, 1), "children": [], "meta": {}}],
+        [{"id": "1", "created_at": datetime(2026, 1, 1, 9, 30, 0, 250000, tzinfo=timezone.utc)}],
+    ])
+    def test_matches_one_shot_dump(self, items, capsys):
+        from accomplis.cli import _json_default, output_json, output_json_stream
+
+        expected = json.dumps(items, indent=2, default=_json_default) + "\n"
+        output_json_stream(iter(items))
+        assert capsys.readouterr().out == expected
+        output_json(items)
+        assert capsys.readouterr().out == expected
+
+    def test_sdk_models_match_their_to_dict(self, capsys):
+        from todoist_api_python.models import Comment, Task
+
+        from accomplis.cli import output_json_stream
+
+        task = Task.from_dict({
+            "id": "1", "content": "x", "description": "", "project_id": "p1",
+            "section_id": None, "parent_id": None, "labels": ["a"], "priority": 1,
+            "due": {"date": "2026-01-02", "is_recurring": False, "string": "tomorrow"},
+            "deadline": None, "duration": None, "is_collapsed": False, "child_order": 1,
+            "responsible_uid": None, "assigned_by_uid": None, "added_by_uid": "u1",
+            "added_at": "2026-01-01T00:00:00Z", "updated_at": "2026-01-01T09:30:00.123456Z",
+            "completed_at": None,
+        })
+        comment = Comment.from_dict({
+            "id": "c1", "content": "hi", "posted_uid": "u1", "item_id": "1",
+            "posted_at": "2026-01-01T00:00:00Z",
+        })
+        output_json_stream([task, {"comments": [comment]}])
+
+        expected = [task.to_dict(), {"comments": [comment.to_dict()]}]
+        assert capsys.readouterr().out == json.dumps(expected, indent=2) + "\n"
+
+    def test_datetimes_in_sdk_format(self, capsys):
+        from accomplis.cli import output_json
+
+        output_json({"at": datetime(2026, 1, 1, tzinfo=timezone.utc), "task": make_comment("hi")})
+        assert json.loads(capsys.readouterr().out) == {
+            "at": "2026-01-01T00:00:00Z",
+            "task": {"content": "hi", "attachment": None},
+        }
+
+    def test_pages_are_consumed_lazily(self, capsys):
+        from accomplis.cli import output_json_stream
+        from accomplis.common import iter_paginated
+
+        def pages():
+            yield [{"id": "1"}]
+            assert '"1"' in capsys.readouterr().out  # page 1 written before page 2 fetched
+            yield [{"id": "2"}]
+
+        output_json_stream(iter_paginated(pages()))
+
+
+class TestImapConcurrent:
+    def test_results_in_input_order(self):
+        import time
+
+        from accomplis.common import imap_concurrent
+
+        def slow_for_small(n):
+            time.sleep(0.01 * (5 - n))
+            return n * 10
+
+        assert list(imap_concurrent(slow_for_small, range(5))) == [0, 10, 20, 30, 40]
+
+    def test_work_overlaps_producing_later_items(self):
+        """Item 1 is already being processed while the next page is still being fetched."""
+        import threading
+
+        from accomplis.common import imap_concurrent
+
+        started = threading.Event()
+
+        def items():
+            yield 1
+            assert started.wait(timeout=1)
+            yield 2
+
+        def work(n):
+            started.set()
+            return n
+
+        assert list(imap_concurrent(work, items())) == [1, 2]
+
+    def test_first_exception_propagates(self):
+        from accomplis.common import imap_concurrent
+
+        def boom(n):
+            if n == 2:
+                raise ValueError("page 2")
+            return n
+
+        with pytest.raises(ValueError):
+            list(imap_concurrent(boom, [1, 2, 3]))
+
+    def test_reads_ahead_a_bounded_number_of_items(self):
+        """Slow work must not let the whole input be pulled into memory."""
+        import threading
+        import time
+
+        from accomplis.common import imap_concurrent
+
+        pulled = []
+        gate = threading.Event()
+
+        def items():
+            for n in range(100):
+                pulled.append(n)
+                yield n
+
+        def work(n):
+            gate.wait(timeout=5)
+            return n
+
+        results = imap_concurrent(work, items(), max_workers=2)
+        consumer = threading.Thread(target=next, args=(results,))
+        consumer.start()
+        time.sleep(0.2)
+        try:
+            assert len(pulled) <= 1 + 2 * 2
+        finally:
+            gate.set()
+            consumer.join()
+            results.close()
+
+
+class TestWorkspaceNotice:
+    @patch("accomplis.cli.get_current_user")
+    @patch("accomplis.cli.get_api")
+    @patch("accomplis.cli.resolve_project_object")
+    def test_notice_counts_after_streaming(self, mock_resolve, mock_api, mock_user, capsys):
+        from accomplis.cli import cmd_get_tasks
+
+        mock_resolve.return_value = make_project("p1", "Board", workspace_id="ws1")
+        mock_user.return_value = {"id": "100", "full_name": "Me"}
+        api = MagicMock()
+        mock_api.return_value = api
+
+        def pages():
+            yield [make_task("t1", "Mine", assignee_id="100"), make_task("t2", "Theirs", assignee_id="200")]
+            yield [make_task("t3", "Mine too", assignee_id="100")]
+
+        api.get_tasks.return_value = pages()
+        api.get_collaborators.return_value = paginated(make_collaborator("100", "Me"))
+        api.get_comments.side_effect = lambda task_id: paginated()
+
+        args = SimpleNamespace(
+            project="Board", project_id=None, section=None, section_id=None,
+            label=None, assignee=None, team=False, unassigned=False,
+            created_before=None, older_than=None, include_section_name=False,
+        )
+        cmd_get_tasks(args)
+
+        captured = capsys.readouterr()
+        assert [t["id"] for t in json.loads(captured.out)] == ["t1", "t3"]
+        assert "Showing 2 of 3 tasks (assigned to Me)" in captured.err
+
+
+class TestProjectArgConflict:
+    @patch("accomplis.cli.get_api")
+    def test_disagreeing_project_and_id_rejected(self, mock_api, capsys):
+        from accomplis.cli import cmd_add_section
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_projects.return_value = paginated(make_project("p1", "Work"))
+
+        with pytest.raises(SystemExit):
+            cmd_add_section(SimpleNamespace(name="Now", project="Work", project_id="p2"))
+        assert "--project-id is p2" in capsys.readouterr().err
+        api.add_section.assert_not_called()
+
+    @patch("accomplis.cli.get_api")
+    def test_agreeing_project_and_id_accepted(self, mock_api, capsys):
+        from accomplis.cli import cmd_add_section
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_projects.return_value = paginated(make_project("p1", "Work"))
+        api.add_section.return_value = {"id": "s1"}
+
+        cmd_add_section(SimpleNamespace(name="Now", project="Work", project_id="p1"))
+        api.add_section.assert_called_once_with(name="Now", project_id="p1")
+
+
+class TestIdShortCircuit:
+    """A v1-shaped ID argument is tried with one GET before any list fetch."""
+
+    def test_project_id_skips_listing(self):
+        from accomplis.common import resolve_project
+
+        api = MagicMock()
+        api.get_project.return_value = make_project("6Jf8VQXxpwv56VQ7", "Work")
+
+        assert resolve_project(api, "6Jf8VQXxpwv56VQ7") == "6Jf8VQXxpwv56VQ7"
+        api.get_project.assert_called_once_with("6Jf8VQXxpwv56VQ7")
+        api.get_projects.assert_not_called()
+
+    def test_all_digit_name_never_tried_as_id(self):
+        from accomplis.common import resolve_project_object
+
+        api = MagicMock()
+        api.get_projects.return_value = paginated(make_project("p9", "2026"))
+
+        assert resolve_project_object(api, "2026").id == "p9"
+        api.get_project.assert_not_called()
+
+    def test_id_shaped_name_falls_back_on_404(self):
+        from accomplis.common import resolve_project_object
+
+        api = MagicMock()
+        api.get_project.side_effect = status_error(404)
+        api.get_projects.return_value = paginated(make_project("p9", "Quarter4Planning"))
+
+        assert resolve_project_object(api, "Quarter4Planning").id == "p9"
+
+    def test_auth_failure_propagates(self):
+        from accomplis.common import resolve_project
+
+        api = MagicMock()
+        api.get_project.side_effect = status_error(401)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            resolve_project(api, "6Jf8VQXxpwv56VQ7")
+        api.get_projects.assert_not_called()
+
+    def test_section_id_must_belong_to_project(self, capsys):
+        from accomplis.common import resolve_section
+
+        api = MagicMock()
+        api.get_section.return_value = SimpleNamespace(
+            id="6Jf8VQXxpwv56VQ8", name="Now", project_id="other")
+        api.get_sections.return_value = paginated(SimpleNamespace(id="s1", name="Now"))
+
+        with pytest.raises(SystemExit):
+            resolve_section(api, "p1", "6Jf8VQXxpwv56VQ8")
+        assert "not found in project" in capsys.readouterr().err
+
+    def test_section_id_skips_listing(self):
+        from accomplis.common import resolve_section
+
+        api = MagicMock()
+        api.get_section.return_value = SimpleNamespace(
+            id="6Jf8VQXxpwv56VQ8", name="Now", project_id="p1")
+
+        assert resolve_section(api, "p1", "6Jf8VQXxpwv56VQ8") == "6Jf8VQXxpwv56VQ8"
+        api.get_sections.assert_not_called()
+
+
+class TestToDict:
+    def test_sdk_model_uses_its_to_dict(self):
+        from todoist_api_python.models import Section
+
+        from accomplis.common import to_dict
+
+        section = Section(id="s1", name="Now", project_id="p1", is_collapsed=False, order=1)
+        assert to_dict(section) == section.to_dict()
+        assert to_dict(section) == section.to_dict()  # cached strategy, same result
+
+    def test_plain_object_drops_private_attrs(self):
+        from accomplis.common import to_dict
+
+        obj = SimpleNamespace(id="1", _secret="x")
+        assert to_dict(obj) == {"id": "1"}
+
+    def test_instance_to_dict_is_honoured(self):
+        from accomplis.common import to_dict
+
+        assert to_dict(make_comment("hi")) == {"content": "hi", "attachment": None}
+        assert to_dict(SimpleNamespace(id="2")) == {"id": "2"}  # same type, no to_dict
+
+    def test_dict_passes_through(self):
+        from accomplis.common import to_dict
+
+        d = {"id": "1"}
+        assert to_dict(d) is d
+
+
+class TestVersion:
+    def test_metadata_not_read_unless_asked(self, monkeypatch):
+        from accomplis import cli
+
+        monkeypatch.setattr(sys, "argv", ["accomplis", "projects"])
+        with patch.object(cli, "package_version") as mock_version, \
+                patch.object(cli, "cmd_get_projects"):
+            cli.main()
+        mock_version.assert_not_called()
+
+    def test_version_flag(self, monkeypatch, capsys):
+        from accomplis import cli
+
+        monkeypatch.setattr(sys, "argv", ["accomplis", "--version"])
+        with patch.object(cli, "package_version", return_value="9.9.9"):
+            with pytest.raises(SystemExit) as exc:
+                cli.main()
+        assert exc.value.code == 0
+        assert capsys.readouterr().out == "accomplis 9.9.9\n"
+
+
+class TestLazySubparsers:
+    def test_only_invoked_command_gets_arguments(self, monkeypatch):
+        from accomplis import cli
+
+        built = []
+        table = [(name, help_text, (lambda p, n=name, f=fn: (built.append(n), f(p))) if fn else None)
+                 for name, help_text, fn in cli.SUBCOMMANDS]
+        monkeypatch.setattr(cli, "SUBCOMMANDS", table)
+        monkeypatch.setattr(sys, "argv", ["accomplis", "tasks", "--project", "@Wait"])
+        with patch.object(cli, "cmd_get_tasks") as mock_cmd:
+            cli.main()
+        assert built == ["tasks"]
+        assert mock_cmd.call_args[0][0].project == "@Wait"
+
+    def test_top_level_help_lists_every_command(self, monkeypatch, capsys):
+        from accomplis import cli
+
+        monkeypatch.setattr(sys, "argv", ["accomplis", "--help"])
+        with pytest.raises(SystemExit):
+            cli.main()
+        out = capsys.readouterr().out
+        for name, _, _ in cli.SUBCOMMANDS:
+            assert name in out
+
+
+class TestCreatedBefore:
+    def test_string_and_datetime_created_at(self):
+        from datetime import datetime, timezone
+        from accomplis.cli import _created_before
+
+        before = _created_before(datetime(2026, 1, 1, 12, 0, 0, 500000))
+        assert before(make_task("1", "a", created_at="2026-01-01T12:00:00Z"))
+        assert not before(make_task("2", "b", created_at="2026-01-01T12:00:01Z"))
+        assert before(make_task("3", "c", created_at=datetime(2026, 1, 1, 11, tzinfo=timezone.utc)))
+        assert not before(make_task("4", "d", created_at=datetime(2026, 1, 2, tzinfo=timezone.utc)))
+
+
+class TestDateCutoff:
+    def test_created_before_is_end_of_local_day_in_utc(self, monkeypatch):
+        import time
+
+        from accomplis.cli import _date_cutoff
+
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            cutoff = _date_cutoff(date_filter_args(older_than=None, created_before="2026-01-15"))
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+        assert cutoff == datetime(2026, 1, 16, 4, 59, 59)  # 23:59:59 EST
+
+    def test_older_than_counts_from_utc_now(self):
+        from accomplis.cli import _date_cutoff
+
+        cutoff = _date_cutoff(date_filter_args(older_than="1d"))
+        now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+        assert abs((now_utc - cutoff).total_seconds() - 86400) < 5
+
+
+def status_error(code, body=""):
+    request = httpx.Request("GET", "https://api.todoist.com/api/v1/tasks/t1")
+    response = httpx.Response(code, text=body, request=request)
+    return httpx.HTTPStatusError(f"{code}", request=request, response=response)
+
+
+class TestErrorClassification:
+    @pytest.mark.parametrize("code", [400, 404])
+    def test_task_not_found_on_typed_status(self, code, capsys):
+        from accomplis.common import handle_task_not_found
+
+        with pytest.raises(SystemExit):
+            try:
+                raise status_error(code)
+            except Exception as e:
+                handle_task_not_found(e, "t1")
+        assert "not found or invalid" in capsys.readouterr().err
+
+    def test_other_errors_mentioning_404_propagate(self):
+        from accomplis.common import handle_task_not_found
+
+        with pytest.raises(ValueError):
+            try:
+                raise ValueError("page 404 of results")
+            except Exception as e:
+                handle_task_not_found(e, "t1")
+
+    @pytest.mark.parametrize("exc, message", [
+        (httpx.ReadTimeout("slow"), "timed out"),
+        (httpx.ConnectError("refused"), "Could not connect"),
+        (status_error(401), "Token expired or revoked"),
+    ])
+    def test_main_maps_network_errors(self, exc, message, monkeypatch, capsys):
+        from accomplis import cli
+
+        monkeypatch.setattr(sys, "argv", ["accomplis", "projects"])
+        with patch.object(cli, "cmd_get_projects", side_effect=exc):
+            with pytest.raises(SystemExit):
+                cli.main()
+        assert message in capsys.readouterr().err
+
+    @patch("accomplis.cli.get_api")
+    def test_move_400_reads_reason_from_body(self, mock_api, capsys):
+        from accomplis.cli import cmd_update_task
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.move_task.side_effect = status_error(400, '{"error": "Cannot move to another workspace"}')
+
+        with pytest.raises(SystemExit):
+            cmd_update_task(make_update_args(project_id="p2"))
+        assert "between workspaces" in capsys.readouterr().err
+
+
+class TestCollectPaginated:
+    def test_single_page_returned_without_copy(self):
+        from accomplis.common import collect_paginated
+
+        page = [make_project("p1", "A")]
+        assert collect_paginated(iter([page])) is page
+
+    @pytest.mark.parametrize("pages, expected", [
+        ([], []),
+        ([[1, 2]], [1, 2]),
+        ([[1], [], [2, 3]], [1, 2, 3]),
+        ([(1, 2), (3,)], [1, 2, 3]),
+    ])
+    def test_flattens_pages(self, pages, expected):
+        from accomplis.common import collect_paginated
+
+        assert collect_paginated(iter(pages)) == expected
+
+
+class TestPrefetchPages:
+    def test_next_page_fetched_while_current_is_processed(self):
+        import threading
+
+        from accomplis.common import prefetch_pages
+
+        second_requested = threading.Event()
+
+        def pages():
+            yield [1]
+            second_requested.set()
+            yield [2]
+
+        it = prefetch_pages(pages())
+        assert next(it) == [1]
+        # Page 2's fetch runs in the background before anyone asks for it
+        assert second_requested.wait(timeout=2)
+        assert list(it) == [[2]]
+
+    def test_errors_surface_to_the_consumer(self):
+        from accomplis.common import prefetch_pages
+
+        def pages():
+            yield [1]
+            raise RuntimeError("page 2 failed")
+
+        it = prefetch_pages(pages())
+        assert next(it) == [1]
+        with pytest.raises(RuntimeError, match="page 2 failed"):
+            next(it)
+
+
+class TestCompleted:
+    @patch("accomplis.cli.get_api")
+    def test_pages_stream_in_order(self, mock_api, capsys):
+        from accomplis.cli import cmd_get_completed
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_completed_tasks_by_completion_date.return_value = iter(
+            [[make_task("t1", "A")], [make_task("t2", "B")]]
+        )
+
+        cmd_get_completed(SimpleNamespace(since="2026-01-01", until=None, project=None))
+
+        assert [t["id"] for t in json.loads(capsys.readouterr().out)] == ["t1", "t2"]
+
+    @patch("accomplis.cli.get_api")
+    def test_first_page_error_is_clean(self, mock_api, capsys):
+        from accomplis.cli import cmd_get_completed
+
+        def pages(**kwargs):
+            raise status_error(400)
+            yield  # generator: the error surfaces on the first page, as in the SDK
+
+        api = MagicMock()
+        mock_api.return_value = api
+        api.get_completed_tasks_by_completion_date.side_effect = pages
+
+        with pytest.raises(SystemExit):
+            cmd_get_completed(SimpleNamespace(since="2026-01-01", until=None, project=None))
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert captured.err.startswith("Error:")
+
+
+class TestOlderThan:
+    @pytest.mark.parametrize("value", ["30dxyz", "x30d", "30", "d"])
+    def test_malformed_values_rejected(self, value, capsys):
+        from accomplis.cli import cmd_get_tasks
+
+        with pytest.raises(SystemExit):
+            cmd_get_tasks(date_filter_args(older_than=value))
+        assert "--older-than format" in capsys.readouterr().err
@@ -0,0 +1,111 @@
+"""Daemon mode: forwarded calls must behave like local ones."""
+
+import json
+import os
+import socket
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from accomplis import cli, daemon
+
+
+def run_via_socketpair(argv):
+    """Serve one request on a socketpair, returning the client's view of the response."""
+    server_end, client_end = socket.socketpair()
+    worker = threading.Thread(target=daemon.handle, args=(server_end,))
+    worker.start()
+    try:
+        return daemon._exchange(client_end, argv)
+    finally:
+        worker.join()
+        server_end.close()
+        client_end.close()
+
+
+class TestHandle:
+    def test_output_and_exit_code_round_trip(self):
+        def fake_projects(args):
+            print(json.dumps([{"id": "p1"}]))
+            print("note", file=sys.stderr)
+
+        with patch.object(cli, "cmd_get_projects", side_effect=fake_projects):
+            response = run_via_socketpair(["projects"])
+
+        assert json.loads(response["stdout"]) == [{"id": "p1"}]
+        assert response["stderr"] == "note\n"
+        assert response["code"] == 0
+
+    def test_failure_exit_code_reported(self):
+        def not_found(args):
+            print("Error: Project 'x' not found", file=sys.stderr)
+            sys.exit(1)
+
+        with patch.object(cli, "cmd_get_sections", side_effect=not_found):
+            response = run_via_socketpair(["sections", "--project", "x"])
+
+        assert response["code"] == 1
+        assert "not found" in response["stderr"]
+
+    def test_memo_cleared_per_request(self):
+        with patch.object(cli, "cmd_get_projects"), \
+                patch("accomplis.common.clear_fetch_cache") as mock_clear:
+            run_via_socketpair(["projects"])
+            run_via_socketpair(["projects"])
+        assert mock_clear.call_count == 2
+
+
+class TestForwarding:
+    def test_no_daemon_means_none(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert daemon.forward(["projects"]) is None
+
+    def test_main_forwards_when_enabled(self, monkeypatch):
+        monkeypatch.setenv("ACCOMPLIS_DAEMON", "1")
+        with patch.object(daemon, "forward", return_value=0) as mock_forward, \
+                patch.object(cli, "cmd_get_projects") as mock_cmd:
+            with pytest.raises(SystemExit) as exc:
+                cli.main(["projects"])
+        assert exc.value.code == 0
+        mock_forward.assert_called_once_with(["projects"])
+        mock_cmd.assert_not_called()
+
+    def test_main_runs_locally_without_daemon(self, monkeypatch):
+        monkeypatch.setenv("ACCOMPLIS_DAEMON", "1")
+        with patch.object(daemon, "forward", return_value=None), \
+                patch.object(cli, "cmd_get_projects") as mock_cmd:
+            cli.main(["projects"])
+        mock_cmd.assert_called_once()
+
+    def test_local_commands_never_forwarded(self, monkeypatch):
+        monkeypatch.setenv("ACCOMPLIS_DAEMON", "1")
+        with patch.object(daemon, "forward") as mock_forward, \
+                patch.object(cli, "cmd_doctor"):
+            cli.main(["doctor"])
+        mock_forward.assert_not_called()
+
+    def test_add_batch_runs_locally(self, monkeypatch):
+        """add-batch reads the caller's stdin and cwd, which the daemon can't see."""
+        monkeypatch.setenv("ACCOMPLIS_DAEMON", "1")
+        with patch.object(daemon, "forward") as mock_forward, \
+                patch.object(cli, "cmd_add_batch") as mock_cmd:
+            cli.main(["add-batch", "--file", "tree.json"])
+        mock_forward.assert_not_called()
+        mock_cmd.assert_called_once()
+
+    def test_foreign_socket_ignored(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        (tmp_path / "accomplis.sock").touch()
+        with patch.object(daemon.os, "getuid", return_value=os.getuid() + 1), \
+                patch.object(daemon.socket, "socket") as mock_socket:
+            assert daemon.forward(["projects"]) is None
+        mock_socket.assert_not_called()
+
+    def test_daemon_hanging_up_is_a_clean_error(self, capsys):
+        server_end, client_end = socket.socketpair()
+        server_end.close()  # accepted, then died before replying
+        with patch.object(daemon, "_connect", return_value=client_end):
+            assert daemon.forward(["add", "Buy milk"]) == 1
+        assert "hung up" in capsys.readouterr().err
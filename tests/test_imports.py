@@ -16,7 +16,9 @@ MODULES = [
     "accomplis.auth",
     "accomplis.cli",
     "accomplis.common",
+    "accomplis.daemon",
     "accomplis.flatten",
+    "accomplis.name_cache",
     "accomplis.token_store",
 ]
 
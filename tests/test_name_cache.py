@@ -0,0 +1,75 @@
+"""Disk name cache: hits skip the listing, and misses or staleness never give wrong IDs."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from accomplis import common, name_cache
+
+
+def paginated(*items):
+    return iter([list(items)])
+
+
+class TestStore:
+    def test_round_trip_is_case_insensitive(self):
+        name_cache.remember("tok", "projects", {"work": "p1"})
+        assert name_cache.lookup("tok", "projects", "Work") == "p1"
+        assert name_cache.lookup("tok", "projects", "Home") is None
+
+    def test_other_account_misses(self):
+        name_cache.remember("tok", "projects", {"work": "p1"})
+        assert name_cache.lookup("other-token", "projects", "work") is None
+
+    def test_expired_entry_misses(self):
+        name_cache.remember("tok", "projects", {"work": "p1"})
+        later = name_cache.time.time() + name_cache.TTL_SECONDS + 1
+        with patch.object(name_cache.time, "time", return_value=later):
+            assert name_cache.lookup("tok", "projects", "work") is None
+
+    def test_corrupt_file_misses(self):
+        path = name_cache.cache_file()
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+        assert name_cache.lookup("tok", "projects", "work") is None
+
+    def test_no_token_never_touches_disk(self):
+        name_cache.remember(None, "projects", {"work": "p1"})
+        assert not name_cache.cache_file().exists()
+
+
+class TestResolvers:
+    def _real_api(self, monkeypatch):
+        """A stand-in registered as the process's real client, so the cache applies."""
+        api = MagicMock()
+        monkeypatch.setattr(common, "_API", api)
+        monkeypatch.setattr(common, "_API_TOKEN", "tok")
+        return api
+
+    def test_second_invocation_skips_listing(self, monkeypatch):
+        api = self._real_api(monkeypatch)
+        api.get_projects.side_effect = lambda: paginated(SimpleNamespace(id="p1", name="Work"))
+
+        assert common.resolve_project(api, "Work") == "p1"
+        common.clear_fetch_cache()  # as if a fresh process
+        assert common.resolve_project(api, "work") == "p1"
+        assert api.get_projects.call_count == 1
+
+    def test_sections_cached_per_project(self, monkeypatch):
+        api = self._real_api(monkeypatch)
+        api.get_sections.side_effect = lambda project_id: paginated(
+            SimpleNamespace(id=f"{project_id}-s", name="Now"))
+
+        assert common.resolve_section(api, "p1", "Now") == "p1-s"
+        common.clear_fetch_cache()
+        assert common.resolve_section(api, "p1", "Now") == "p1-s"
+        assert common.resolve_section(api, "p2", "Now") == "p2-s"
+        assert api.get_sections.call_count == 2
+
+    def test_names_changed_forces_refetch(self, monkeypatch):
+        api = self._real_api(monkeypatch)
+        api.get_projects.side_effect = lambda: paginated(SimpleNamespace(id="p1", name="Work"))
+
+        common.resolve_project(api, "Work")
+        common.names_changed()
+        common.resolve_project(api, "Work")
+        assert api.get_projects.call_count == 2
@@ -89,3 +89,12 @@ def test_persistent_503_gives_up():
         resp = client.get("https://api.todoist.com/api/v1/comments")
     assert resp.status_code == 503
     assert len(calls) == MAX_RETRIES + 1
+
+
+def test_http1_fallback_without_h2(monkeypatch):
+    import accomplis.common as common
+
+    monkeypatch.setattr(common, "find_spec", lambda name: None)
+    transport = make_retry_transport()
+    assert transport._inner._pool._http2 is False
+    transport.close()
@@ -24,6 +24,7 @@ def stores(tmp_path, monkeypatch):
         token_store, "_OLD_PLUGIN_DATA_DIRS", (old_rename.parent, old_cutover.parent)
     )
     monkeypatch.setattr(token_store, "_LEGACY_TOKEN_FILE", legacy)
+    monkeypatch.setattr(token_store, "_memo", None)
     return new, old_rename, old_cutover, legacy
 
 
@@ -99,3 +100,75 @@ def test_not_found_error_names_resolved_paths(stores, monkeypatch, capsys):
     assert "HOME=" in err
     assert "USER=" in err
     assert "~/" not in err  # resolved paths only, no templates
+
+
+def test_store_skips_token_already_stored(stores, monkeypatch):
+    new, *_ = stores
+    monkeypatch.setattr(token_store, "_has_keychain", lambda: False)
+    new.parent.mkdir(parents=True)
+    new.write_text("abc\n")
+    mtime = new.stat().st_mtime_ns
+
+    assert token_store.store_token("abc") == token_store.UNCHANGED
+    assert new.stat().st_mtime_ns == mtime  # untouched
+
+    assert token_store.store_token("def") is True
+    assert new.read_text() == "def\n"
+
+
+def test_persisted_token_read_once_until_stored(stores, monkeypatch):
+    new, *_ = stores
+    monkeypatch.delenv("TODOIST_API_KEY", raising=False)
+    reads = []
+    monkeypatch.setattr(token_store, "_get_from_keychain", lambda: reads.append(1) or "abc")
+    monkeypatch.setattr(token_store, "_has_keychain", lambda: False)
+
+    assert token_store.get_token() == "abc"
+    assert token_store.get_token_quiet() == "abc"
+    assert len(reads) == 1
+
+    token_store.store_token("def")
+    monkeypatch.setattr(token_store, "_get_from_keychain", lambda: None)
+    assert token_store.get_token() == "def"  # re-read from the file just written
+
+
+def test_keychain_store_is_a_single_upsert(monkeypatch):
+    import subprocess
+
+    calls = []
+    monkeypatch.setattr(token_store, "_has_keychain", lambda: True)
+    monkeypatch.setattr(token_store, "_user", lambda: "me")
+    monkeypatch.setattr(subprocess, "run", lambda cmd, **kw: calls.append(cmd))
+
+    assert token_store._store_to_keychain("abc")
+    assert calls == [["security", "add-generic-password", "-U", "-a", "me",
+                      "-s", token_store.KEYCHAIN_SERVICE, "-w", "abc"]]
+
+
+def test_file_store_is_private_and_leaves_no_temp_file(stores):
+    import os
+
+    new, *_ = stores
+    old_umask = os.umask(0o022)
+    try:
+        assert token_store._store_to_file("tok-new")
+    finally:
+        os.umask(old_umask)
+    assert new.read_text() == "tok-new\n"
+    assert new.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in new.parent.iterdir()] == ["token"]
+
+
+def test_auth_reports_unchanged_token_once(stores, monkeypatch, capsys):
+    from accomplis.auth import store_api_token
+
+    new, *_ = stores
+    monkeypatch.setattr(token_store, "_has_keychain", lambda: False)
+    token = "0123456789abcdef0123456789abcdef01234567"
+    new.parent.mkdir(parents=True)
+    new.write_text(token + "\n")
+
+    assert store_api_token(token)
+    captured = capsys.readouterr()
+    assert "already stored" in captured.out
+    assert "Token stored" not in captured.out + captured.err